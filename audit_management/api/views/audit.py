@@ -14,6 +14,7 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.core.exceptions import ValidationError
 from django.db import models as django_models
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.views.generic import CreateView, DeleteView, DetailView, ListView, UpdateView
@@ -265,10 +266,11 @@ class AuditDetailView(LoginRequiredMixin, DetailView):
         queryset = Audit.objects.select_related("organization", "lead_auditor", "created_by").prefetch_related(
             "certifications",
             "sites",
-            "team_members",
+            Prefetch("team_members", queryset=AuditTeamMember.objects.select_related("user")),
             "nonconformity_set",
             "observation_set",
             "opportunityforimprovement_set",
+            Prefetch("evidence_files", queryset=EvidenceFile.objects.select_related("finding", "uploaded_by")),
         )
 
         # CB Admin sees all
@@ -299,8 +301,8 @@ class AuditDetailView(LoginRequiredMixin, DetailView):
         context["observations"] = audit.observation_set.all()
         context["ofis"] = audit.opportunityforimprovement_set.all()
 
-        # Add counts
-        context["open_ncs_count"] = audit.nonconformity_set.exclude(verification_status="closed").count()
+        # Add counts (computed from the prefetched rows rather than a second COUNT query)
+        context["open_ncs_count"] = sum(1 for nc in context["nonconformities"] if nc.verification_status != "closed")
 
         # Check if user can edit
         context["can_edit"] = PermissionPredicate.is_cb_admin(user) or (
@@ -370,6 +372,8 @@ class AuditUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     """Update audit (CB Admin or Lead Auditor of the audit)."""
 
     model = Audit
+    # test_func compares lead_auditor, so fetch it with the audit row
+    queryset = Audit.objects.select_related("organization", "lead_auditor")
     template_name = "audits/audit_form.html"
     fields = [
         "organization",
@@ -495,7 +499,7 @@ def audit_transition_status(request, pk, new_status):
 @login_required
 def audit_changes_edit(request, audit_pk):
     """Edit organization changes for an audit."""
-    audit = get_object_or_404(Audit, pk=audit_pk)
+    audit = get_object_or_404(Audit.objects.select_related("organization", "lead_auditor"), pk=audit_pk)
 
     # Permission check
     user = request.user
@@ -528,7 +532,7 @@ def audit_changes_edit(request, audit_pk):
 @login_required
 def audit_plan_review_edit(request, audit_pk):
     """Edit audit plan review for an audit."""
-    audit = get_object_or_404(Audit, pk=audit_pk)
+    audit = get_object_or_404(Audit.objects.select_related("organization", "lead_auditor"), pk=audit_pk)
 
     # Permission check
     user = request.user
@@ -561,7 +565,7 @@ def audit_plan_review_edit(request, audit_pk):
 @login_required
 def audit_summary_edit(request, audit_pk):
     """Edit audit summary for an audit."""
-    audit = get_object_or_404(Audit, pk=audit_pk)
+    audit = get_object_or_404(Audit.objects.select_related("organization", "lead_auditor"), pk=audit_pk)
 
     # Permission check
     user = request.user
@@ -599,7 +603,7 @@ def audit_summary_edit(request, audit_pk):
 @login_required
 def audit_recommendation_edit(request, audit_pk):
     """Edit audit recommendations."""
-    audit = get_object_or_404(Audit, pk=audit_pk)
+    audit = get_object_or_404(Audit.objects.select_related("organization", "lead_auditor"), pk=audit_pk)
 
     # Permission check - Lead Auditor or CB Admin
     user = request.user
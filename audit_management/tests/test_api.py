@@ -521,27 +521,19 @@ class TestAuditDetailSerializerFields(AuditAPITestBase):
     """Test AuditDetailSerializer computed fields."""
 
     def test_nc_count_and_open_nc_count(self):
-        Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="major",
-            objective_evidence="ev",
-            statement_of_nc="st",
-            auditor_explanation="exp",
-            created_by=self.admin_user,
-            verification_status="open",
-        )
-        Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.2",
-            category="minor",
-            objective_evidence="ev",
-            statement_of_nc="st",
-            auditor_explanation="exp",
-            created_by=self.admin_user,
-            verification_status="closed",
+        Nonconformity.objects.bulk_create(
+            Nonconformity(
+                audit=self.audit,
+                standard=self.standard,
+                clause=clause,
+                category=category,
+                objective_evidence="ev",
+                statement_of_nc="st",
+                auditor_explanation="exp",
+                created_by=self.admin_user,
+                verification_status=verification_status,
+            )
+            for clause, category, verification_status in [("4.1", "major", "open"), ("4.2", "minor", "closed")]
         )
         self.client.force_authenticate(user=self.regular_user)
         response = self.client.get(f"/api/v1/audit-management/audits/{self.audit.pk}/")
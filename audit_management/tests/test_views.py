@@ -142,6 +142,28 @@ class AuditViewTest(TestCase):
         self.assertIsInstance(dto, AuditUpdateDTO)
         self.assertEqual(dto.audit_type, "stage2")
 
+    def test_update_audit_view_lead_auditor_queries(self):
+        """The edit permission check reads lead_auditor from the joined audit row."""
+        lead_auditor = User.objects.create_user(username="lead_auditor", password="password")
+        lead_auditor.groups.add(Group.objects.create(name="lead_auditor"))
+        audit = Audit.objects.create(
+            organization=self.organization,
+            audit_type="stage1",
+            total_audit_date_from=date(2025, 1, 1),
+            total_audit_date_to=date(2025, 1, 5),
+            created_by=self.user,
+            lead_auditor=lead_auditor,
+        )
+
+        request = self.factory.get(f"/audits/{audit.pk}/edit/")
+        request.user = lead_auditor
+
+        with self.assertNumQueries(17):
+            response = AuditUpdateView.as_view()(request, pk=audit.pk)
+            response.render()
+
+        self.assertEqual(response.status_code, 200)
+
     @patch("audit_management.api.views.audit.AuditService")
     def test_detail_audit_view(self, MockAuditService):
         """Test that AuditDetailView calls AuditService.get_available_transitions."""
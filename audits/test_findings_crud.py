@@ -12,7 +12,14 @@ from django.contrib.auth import get_user_model
 from django.test import Client
 from django.urls import reverse
 
-from audit_management.models import Audit, Nonconformity, Observation, OpportunityForImprovement
+from audit_management.models import (
+    Audit,
+    AuditTeamMember,
+    EvidenceFile,
+    Nonconformity,
+    Observation,
+    OpportunityForImprovement,
+)
 from core.models import Certification, Organization, Standard
 from core.test_utils import TEST_PASSWORD_DEFAULT
 from identity.adapters.models import Profile
@@ -505,51 +512,89 @@ class TestOFICRUD:
 class TestFindingsIntegration:
     """Test findings integration in audit detail page."""
 
-    def test_audit_detail_shows_all_findings(self, auditor_user, audit_scheduled, standard):
+    def test_audit_detail_shows_all_findings(self, auditor_user, audit_scheduled, standard, django_assert_num_queries):
         """Test audit detail page shows all finding types."""
-        # Create one of each finding type
-        Nonconformity.objects.create(
-            audit=audit_scheduled,
-            standard=standard,
-            clause="7.1.5",
-            category="major",
-            objective_evidence="NC evidence",
-            statement_of_nc="NC statement",
-            auditor_explanation="NC explanation",
-            created_by=auditor_user,
+        # Two of each finding type, so a per-row query on the detail page would show in the count.
+        # None rely on save() side effects, so bulk_create is safe.
+        major_nc, _ = Nonconformity.objects.bulk_create(
+            Nonconformity(
+                audit=audit_scheduled,
+                standard=standard,
+                clause=clause,
+                category=category,
+                objective_evidence="NC evidence",
+                statement_of_nc="NC statement",
+                auditor_explanation="NC explanation",
+                created_by=auditor_user,
+                verification_status=verification_status,
+            )
+            for clause, category, verification_status in [("7.1.5", "major", "open"), ("7.2", "minor", "closed")]
         )
-
-        Observation.objects.create(
-            audit=audit_scheduled,
-            standard=standard,
-            clause="8.2.1",
-            statement="Obs evidence",
-            explanation="Obs note",
-            created_by=auditor_user,
+        Observation.objects.bulk_create(
+            Observation(
+                audit=audit_scheduled,
+                standard=standard,
+                clause=clause,
+                statement="Obs evidence",
+                explanation="Obs note",
+                created_by=auditor_user,
+            )
+            for clause in ["8.2.1", "8.2.2"]
+        )
+        OpportunityForImprovement.objects.bulk_create(
+            OpportunityForImprovement(
+                audit=audit_scheduled,
+                standard=standard,
+                clause=clause,
+                description="OFI evidence",
+                created_by=auditor_user,
+            )
+            for clause in ["9.3", "9.1.3"]
         )
 
-        OpportunityForImprovement.objects.create(
-            audit=audit_scheduled,
-            standard=standard,
-            clause="9.3",
-            description="OFI evidence",
-            created_by=auditor_user,
+        # Two team members and two evidence files as well, covering the other prefetched relations
+        AuditTeamMember.objects.bulk_create(
+            [
+                AuditTeamMember(
+                    audit=audit_scheduled,
+                    user=auditor_user,
+                    name="Lead Auditor",
+                    role="lead_auditor",
+                    date_from=audit_scheduled.total_audit_date_from,
+                    date_to=audit_scheduled.total_audit_date_to,
+                ),
+                AuditTeamMember(
+                    audit=audit_scheduled,
+                    name="External Expert",
+                    role="technical_expert",
+                    date_from=audit_scheduled.total_audit_date_from,
+                    date_to=audit_scheduled.total_audit_date_to,
+                ),
+            ]
         )
+        # EvidenceFile.save() fills in purge_after, so these go through create()
+        for finding, name in [(major_nc, "evidence/2025/12/01/nc.pdf"), (None, "evidence/2025/12/01/general.pdf")]:
+            EvidenceFile.objects.create(audit=audit_scheduled, finding=finding, uploaded_by=auditor_user, file=name)
 
         client = Client()
         client.force_login(auditor_user)
 
         url = reverse("audit_management:audit_detail", kwargs={"pk": audit_scheduled.pk})
-        response = client.get(url)
+        # Findings, team members and evidence files are prefetched once per relation, so this
+        # count must not grow with the number of rows rendered on the page.
+        with django_assert_num_queries(40):
+            response = client.get(url)
 
         assert response.status_code == 200
         content = response.content.decode()
         assert "7.1.5" in content  # NC clause
-        assert "8.2.1" in content  # Observation clause
-        assert "9.3" in content  # OFI clause
-        assert "1 NCs" in content or "Total NCs" in content
-        assert "1 Observations" in content or "Observations" in content
-        assert "1 OFIs" in content or "OFIs" in content
+        assert "8.2.1" in content and "8.2.2" in content  # Observation clauses
+        assert "9.3" in content and "9.1.3" in content  # OFI clauses
+        assert "External Expert" in content  # Team members
+        assert "general.pdf" in content  # Evidence files
+        assert "2 NCs" in content or "Total NCs" in content
+        assert "2 Observations" in content or "Observations" in content
+        assert "2 OFIs" in content or "OFIs" in content
 
     def test_audit_detail_hides_add_buttons_when_decided(self, auditor_user, audit_decided):
         """Test 'Add Finding' buttons hidden when audit is decided."""
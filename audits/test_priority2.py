@@ -4,9 +4,10 @@ Tests for Priority 2 features: Status Workflow, Documentation UI, Recommendation
 
 from datetime import date, timedelta
 
+from django.conf import settings
 from django.contrib.auth.models import Group, User
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import Client, TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 
 from audit_management.models import (
@@ -18,54 +19,92 @@ from audit_management.models import (
     EvidenceFile,
     Nonconformity,
 )
+from certification.models import TechnicalReview
 from core.models import Certification, Organization, Standard
-from core.test_utils import TEST_PASSWORD_DEFAULT
-from identity.adapters.models import Profile
+from core.test_utils import bulk_add_to_groups, bulk_create_users
 from trunk.workflows.audit_workflow import AuditWorkflow
 
 
-class AuditWorkflowTest(TestCase):
-    """Test audit status workflow and transitions."""
+class AuditTestCase(TestCase):
+    """Base class providing an organization with a CB admin and a lead auditor."""
 
-    def setUp(self):
-        self.org = Organization.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the organization, users and groups once per class; tests get isolated copies."""
+        cls.org = Organization.objects.create(
             name="Test Org",
             registered_address="123 St",
             customer_id="ORG001",
             total_employee_count=10,
         )
-        self.std = Standard.objects.create(code="ISO 9001:2015", title="Quality Management Systems")
-        self.cert = Certification.objects.create(
-            organization=self.org,
-            standard=self.std,
+
+        # Tests sign in with force_login, so users get an unusable password and nothing is hashed
+        cls.cb_admin, cls.lead_auditor = bulk_create_users(
+            [User(username="cbadmin"), User(username="lead")], password=None
+        )
+        # Every role group the suite uses, inserted in one statement
+        cls.groups = {
+            group.name: group
+            for group in Group.objects.bulk_create(
+                [Group(name=name) for name in ("cb_admin", "lead_auditor", "auditor", "client_admin")]
+            )
+        }
+        bulk_add_to_groups([(cls.cb_admin, cls.groups["cb_admin"]), (cls.lead_auditor, cls.groups["lead_auditor"])])
+
+    @classmethod
+    def create_certification(cls):
+        """Create the ISO 9001 standard and an active certification for the shared organization."""
+        std = Standard.objects.create(code="ISO 9001:2015", title="Quality Management Systems")
+        cert = Certification.objects.create(
+            organization=cls.org,
+            standard=std,
             certification_scope="Test scope",
             certificate_status="active",
         )
-
-        # Create users
-        self.cb_admin = User.objects.create_user(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.lead_auditor = User.objects.create_user(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.auditor = User.objects.create_user(username="auditor", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-
-        cb_group = Group.objects.create(name="cb_admin")
-        lead_group = Group.objects.create(name="lead_auditor")
-        auditor_group = Group.objects.create(name="auditor")
-
-        self.cb_admin.groups.add(cb_group)
-        self.lead_auditor.groups.add(lead_group)
-        self.auditor.groups.add(auditor_group)
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage2",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=3),
-            planned_duration_hours=24.0,
-            status="draft",
-            created_by=self.cb_admin,
-            lead_auditor=self.lead_auditor,
+        return std, cert
+
+    @classmethod
+    def create_audit(cls, **kwargs):
+        """Create a draft stage 2 audit for the shared organization, overriding any field via kwargs."""
+        fields = {
+            "organization": cls.org,
+            "audit_type": "stage2",
+            "total_audit_date_from": date.today(),
+            "total_audit_date_to": date.today() + timedelta(days=3),
+            "planned_duration_hours": 24.0,
+            "status": "draft",
+            "created_by": cls.cb_admin,
+            "lead_auditor": cls.lead_auditor,
+        }
+        fields.update(kwargs)
+        return Audit.objects.create(**fields)
+
+    @classmethod
+    def create_approved_review(cls, audit):
+        """Create the approved technical review the later workflow stages require."""
+        return TechnicalReview.objects.create(
+            audit=audit,
+            reviewer=cls.cb_admin,
+            scope_verified=True,
+            objectives_verified=True,
+            findings_reviewed=True,
+            conclusion_clear=True,
+            status="approved",
         )
-        self.audit.certifications.add(self.cert)
+
+
+class AuditWorkflowTest(AuditTestCase):
+    """Test audit status workflow and transitions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.std, cls.cert = cls.create_certification()
+        [cls.auditor] = bulk_create_users([User(username="auditor")], password=None)
+        cls.auditor.groups.add(cls.groups["auditor"])
+
+        cls.audit = cls.create_audit()
+        cls.audit.certifications.add(cls.cert)
 
     def test_workflow_draft_to_in_review(self):
         """Test transition from draft to in_review."""
@@ -74,47 +113,29 @@ class AuditWorkflowTest(TestCase):
         self.assertTrue(allowed)
 
         workflow.transition_to("scheduled", self.lead_auditor)
-        self.audit.refresh_from_db()
+        self.audit.refresh_from_db(fields=["status"])
         self.assertEqual(self.audit.status, "scheduled")
 
     def test_workflow_requires_major_nc_responses(self):
         """Test that major NCs must have responses before submitting to CB."""
-        # Create major NC without response
+        # Create major NC without response; the workflow only reads category and the response fields
         nc = Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.std,
-            clause="7.5.1",
-            category="major",
-            objective_evidence="Evidence",
-            statement_of_nc="Statement",
-            auditor_explanation="Explanation",
-            created_by=self.auditor,
-            verification_status="open",
+            audit=self.audit, clause="7.5.1", category="major", created_by=self.auditor, verification_status="open"
         )
 
         # Transition through workflow to report_draft
         self.audit.status = "report_draft"
-        self.audit.save()
+        self.audit.save(update_fields=["status"])
 
         # Transition to client_review
         workflow = AuditWorkflow(self.audit)
         workflow.transition_to("client_review", self.lead_auditor)
-        self.audit.refresh_from_db()
+        self.audit.refresh_from_db(fields=["status"])
 
         # Try to submit - should fail without technical review and NC responses
-        from certification.models import TechnicalReview
-
-        TechnicalReview.objects.create(
-            audit=self.audit,
-            reviewer=self.cb_admin,
-            scope_verified=True,
-            objectives_verified=True,
-            findings_reviewed=True,
-            conclusion_clear=True,
-            status="approved",
-        )
+        self.create_approved_review(self.audit)
 
-        workflow = AuditWorkflow(self.audit)
+        # The workflow reads self.audit on every call, so the refreshed audit is picked up as-is
         allowed = workflow.can_transition_to("submitted")
         # The validation logic in AuditWorkflow.can_transition_to checks TRANSITIONS dict.
         # It does NOT check validation rules (like NC responses).
@@ -139,122 +160,63 @@ class AuditWorkflowTest(TestCase):
         self.assertFalse(allowed)
         self.assertIn("major", reason.lower())
 
-        # Add response
-        nc.verification_status = "client_responded"
-        nc.client_root_cause = "Root cause"
-        nc.client_correction = "Correction"
-        nc.client_corrective_action = "Action"
-        nc.save()
+        # Add response; only these columns change, so write them in one targeted UPDATE
+        Nonconformity.objects.filter(pk=nc.pk).update(
+            verification_status="client_responded",
+            client_root_cause="Root cause",
+            client_correction="Correction",
+            client_corrective_action="Action",
+        )
 
-        # Now should be able to submit
-        try:
+        # Now should be able to submit; the major-NC check is a single query however many NCs exist.
+        # A ValidationError here fails the test directly, as does exceeding the budget.
+        with self.assertNumQueries(1):
             workflow.validate_transition("submitted")
-            allowed = True
-        except Exception:
-            allowed = False
 
-        self.assertTrue(allowed)
-
-    def test_workflow_permission_checks(self):
-        """Test that only authorized users can perform transitions."""
-        workflow = AuditWorkflow(self.audit)
-
-        # Lead auditor can submit to client
-        # Note: AuditWorkflow does NOT check permissions anymore. Permissions are checked in views/services.
-        # So this test is testing the wrong thing if it expects AuditWorkflow to enforce permissions.
-        # However, we can test that the transition is technically valid for the audit state.
-
-        allowed = workflow.can_transition_to("scheduled")
-        self.assertTrue(allowed)
-
-        # Regular auditor cannot submit to client - This part of the test is invalid for AuditWorkflow class now.
-        # We should probably remove the user permission checks from this unit test
-        # or move them to a service/view test.
-        # For now, I will comment out the permission checks that are not supported by AuditWorkflow.
-
-        # allowed, _ = workflow.can_transition("scheduled", self.auditor)
-        # self.assertFalse(allowed)
-
-        # Move to client_review
-        self.audit.status = "client_review"
-        self.audit.save()
-
-        # Create approved technical review (required for transition)
-        from certification.models import TechnicalReview
-
-        TechnicalReview.objects.create(
-            audit=self.audit,
-            reviewer=self.cb_admin,
-            scope_verified=True,
-            objectives_verified=True,
-            findings_reviewed=True,
-            conclusion_clear=True,
-            status="approved",
-        )
 
-        # Create new workflow instance with updated status
-        workflow = AuditWorkflow(self.audit)
+class AuditWorkflowTransitionTableTest(SimpleTestCase):
+    """Test AuditWorkflow.can_transition_to, which only consults the transition table."""
 
-        # Both CB Admin and Lead Auditor can submit after technical review
-        allowed = workflow.can_transition_to("submitted")
-        self.assertTrue(allowed)
+    def test_workflow_permission_checks(self):
+        """Test that the transitions lead auditors and CB admins drive are valid for the audit state."""
+        # AuditWorkflow does not check permissions; views and services do. These checks cover the
+        # state table only, so an unsaved audit is enough.
+        audit = Audit(status="draft")
+        workflow = AuditWorkflow(audit)
+        self.assertTrue(workflow.can_transition_to("scheduled"))
 
-        allowed = workflow.can_transition_to("submitted")
-        self.assertTrue(allowed)
+        # The workflow reads audit.status on every call, so it sees the change without re-creating it
+        audit.status = "client_review"
+        self.assertTrue(workflow.can_transition_to("submitted"))
 
     def test_workflow_decided_is_final(self):
         """Test that decided status cannot be changed."""
-        self.audit.status = "decided"
-        self.audit.save()
+        workflow = AuditWorkflow(Audit(status="decided"))
+        self.assertFalse(workflow.can_transition_to("draft"))
 
-        workflow = AuditWorkflow(self.audit)
-        allowed = workflow.can_transition_to("draft")
-        self.assertFalse(allowed)
 
-
-class AuditDocumentationViewTest(TestCase):
+class AuditDocumentationViewTest(AuditTestCase):
     """Test audit documentation views (Changes, Plan Review, Summary)."""
 
-    def setUp(self):
-        self.client = Client()
-        self.org = Organization.objects.create(
-            name="Test Org",
-            registered_address="123 St",
-            customer_id="ORG001",
-            total_employee_count=10,
-        )
-
-        self.cb_admin = User.objects.create_user(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.lead_auditor = User.objects.create_user(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-
-        cb_group = Group.objects.create(name="cb_admin")
-        lead_group = Group.objects.create(name="lead_auditor")
-
-        self.cb_admin.groups.add(cb_group)
-        self.lead_auditor.groups.add(lead_group)
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage2",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=3),
-            planned_duration_hours=24.0,
-            status="draft",
-            created_by=self.cb_admin,
-            lead_auditor=self.lead_auditor,
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.audit = cls.create_audit()
+        cls.url_changes = reverse("audit_management:audit_changes_edit", args=[cls.audit.pk])
 
     def test_audit_changes_view_get(self):
         """Test GET audit changes edit view."""
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(reverse("audit_management:audit_changes_edit", args=[self.audit.pk]))
+        self.client.force_login(self.lead_auditor)
+        # Session, user, audit with its organization and lead auditor, role checks and the changes row
+        with self.assertNumQueries(14):
+            response = self.client.get(self.url_changes)
         self.assertEqual(response.status_code, 200)
         self.assertIn("form", response.context)
         self.assertIn("audit", response.context)
 
     def test_audit_changes_view_post(self):
         """Test POST audit changes edit view."""
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.lead_auditor)
         data = {
             "change_of_name": True,
             "change_of_scope": False,
@@ -266,7 +228,7 @@ class AuditDocumentationViewTest(TestCase):
             "other_has_change": True,
             "other_description": "Test description",
         }
-        response = self.client.post(reverse("audit_management:audit_changes_edit", args=[self.audit.pk]), data)
+        response = self.client.post(self.url_changes, data)
         self.assertEqual(response.status_code, 302)  # Redirect after success
 
         changes = AuditChanges.objects.get(audit=self.audit)
@@ -277,7 +239,7 @@ class AuditDocumentationViewTest(TestCase):
 
     def test_audit_plan_review_view(self):
         """Test audit plan review edit view."""
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.lead_auditor)
         data = {
             "deviations_yes_no": True,
             "deviations_details": "Deviation details here",
@@ -295,7 +257,7 @@ class AuditDocumentationViewTest(TestCase):
 
     def test_audit_summary_view(self):
         """Test audit summary edit view."""
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.lead_auditor)
         data = {
             "objectives_met": True,
             "objectives_comments": "Objectives met",
@@ -324,49 +286,23 @@ class AuditDocumentationViewTest(TestCase):
         self.assertEqual(summary.general_commentary, "General commentary here")
 
 
-class AuditRecommendationTest(TestCase):
+class AuditRecommendationTest(AuditTestCase):
     """Test audit recommendations and certification decision workflow."""
 
-    def setUp(self):
-        self.client = Client()
-        self.org = Organization.objects.create(
-            name="Test Org",
-            registered_address="123 St",
-            customer_id="ORG001",
-            total_employee_count=10,
-        )
-        self.std = Standard.objects.create(code="ISO 9001:2015", title="Quality Management Systems")
-        self.cert = Certification.objects.create(
-            organization=self.org,
-            standard=self.std,
-            certification_scope="Test scope",
-            certificate_status="active",
-        )
-
-        self.cb_admin = User.objects.create_user(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.lead_auditor = User.objects.create_user(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-
-        cb_group = Group.objects.create(name="cb_admin")
-        lead_group = Group.objects.create(name="lead_auditor")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.std, cls.cert = cls.create_certification()
 
-        self.cb_admin.groups.add(cb_group)
-        self.lead_auditor.groups.add(lead_group)
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="surveillance",  # Use surveillance to avoid stage1 requirement
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=3),
-            planned_duration_hours=24.0,
-            status="client_review",
-            created_by=self.cb_admin,
-            lead_auditor=self.lead_auditor,
-        )
-        self.audit.certifications.add(self.cert)
+        # Use surveillance to avoid stage1 requirement
+        cls.audit = cls.create_audit(audit_type="surveillance", status="client_review")
+        cls.audit.certifications.add(cls.cert)
+        cls.url_recommendation = reverse("audit_management:audit_recommendation_edit", args=[cls.audit.pk])
+        cls.url_decision = reverse("certification:certification_decision_create", args=[cls.audit.pk])
 
     def test_recommendation_view_lead_auditor(self):
         """Test lead auditor can edit recommendations."""
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.lead_auditor)
         data = {
             "special_audit_required": True,
             "special_audit_details": "Special audit needed",
@@ -377,7 +313,7 @@ class AuditRecommendationTest(TestCase):
             "stage2_required": False,
             "decision_notes": "Additional notes",
         }
-        response = self.client.post(reverse("audit_management:audit_recommendation_edit", args=[self.audit.pk]), data)
+        response = self.client.post(self.url_recommendation, data)
         self.assertEqual(response.status_code, 302)
 
         recommendation = AuditRecommendation.objects.get(audit=self.audit)
@@ -386,64 +322,40 @@ class AuditRecommendationTest(TestCase):
 
     def test_recommendation_view_cb_admin(self):
         """Test CB admin can edit recommendations."""
-        self.client.login(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(reverse("audit_management:audit_recommendation_edit", args=[self.audit.pk]))
+        self.client.force_login(self.cb_admin)
+        # Session, user, audit with its organization and lead auditor, role checks and the recommendation row
+        with self.assertNumQueries(12):
+            response = self.client.get(self.url_recommendation)
         self.assertEqual(response.status_code, 200)
 
     def test_decision_view_requires_decision_pending_status(self):
         """Test decision can only be made when status is decision_pending."""
         self.audit.status = "draft"
-        self.audit.save()
+        self.audit.save(update_fields=["status"])
 
-        self.client.login(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(reverse("certification:certification_decision_create", args=[self.audit.pk]))
+        self.client.force_login(self.cb_admin)
+        response = self.client.get(self.url_decision)
         # Should return 403 Forbidden (UserPassesTestMixin returns False)
         self.assertEqual(response.status_code, 403)
 
     def test_decision_view_cb_admin_only(self):
         """Test only CB admin can make decisions."""
         self.audit.status = "decision_pending"
-        self.audit.save()
+        self.audit.save(update_fields=["status"])
 
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(reverse("certification:certification_decision_create", args=[self.audit.pk]))
+        self.client.force_login(self.lead_auditor)
+        response = self.client.get(self.url_decision)
         self.assertEqual(response.status_code, 403)  # Forbidden
 
     def test_make_decision_changes_status(self):
         """Test making decision changes audit status to closed."""
-        from certification.models import TechnicalReview
+        self.client.force_login(self.cb_admin)
 
-        self.client.login(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-
-        # Move audit to client_review
-        self.audit.status = "client_review"
-        self.audit.save()
-
-        # Move to submitted
-        self.client.post(reverse("audit_management:audit_transition_status", args=[self.audit.pk, "submitted"]))
-        self.audit.refresh_from_db()
-        self.assertEqual(self.audit.status, "submitted")
-
-        # Move to technical_review
-        self.client.post(reverse("audit_management:audit_transition_status", args=[self.audit.pk, "technical_review"]))
-        self.audit.refresh_from_db()
-        self.assertEqual(self.audit.status, "technical_review")
-
-        # Create approved technical review (required)
-        TechnicalReview.objects.create(
-            audit=self.audit,
-            reviewer=self.cb_admin,
-            scope_verified=True,
-            objectives_verified=True,
-            findings_reviewed=True,
-            conclusion_clear=True,
-            status="approved",
-        )
-
-        # Move to decision_pending
-        self.client.post(reverse("audit_management:audit_transition_status", args=[self.audit.pk, "decision_pending"]))
-        self.audit.refresh_from_db()
-        self.assertEqual(self.audit.status, "decision_pending")
+        # The transition view is covered by StatusTransitionViewTest and the review-stage rules by the
+        # AuditWorkflow tests; this test is about the decision view, so start from decision_pending
+        self.audit.status = "decision_pending"
+        self.audit.save(update_fields=["status"])
+        self.create_approved_review(self.audit)
 
         # Create certification decision via view
         data = {
@@ -451,63 +363,44 @@ class AuditRecommendationTest(TestCase):
             "decision_notes": "Certification granted",
             "certifications_affected": [self.cert.pk],
         }
-        self.client.post(reverse("certification:certification_decision_create", args=[self.audit.pk]), data)
+        self.client.post(self.url_decision, data)
 
         # Verify status is closed
-        self.audit.refresh_from_db()
+        self.audit.refresh_from_db(fields=["status"])
         self.assertEqual(self.audit.status, "closed")
 
 
-class EvidenceFileManagementTest(TestCase):
+@override_settings(STORAGES={**settings.STORAGES, "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"}})
+class EvidenceFileManagementTest(AuditTestCase):
     """Test evidence file upload, download, and deletion."""
 
-    def setUp(self):
-        self.client = Client()
-        self.org = Organization.objects.create(
-            name="Test Org",
-            registered_address="123 St",
-            customer_id="ORG001",
-            total_employee_count=10,
-        )
-        self.std = Standard.objects.create(code="ISO 9001:2015", title="Quality Management Systems")
-
-        self.cb_admin = User.objects.create_user(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.lead_auditor = User.objects.create_user(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.client_user = User.objects.create_user(username="client", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-
-        cb_group = Group.objects.create(name="cb_admin")
-        lead_group = Group.objects.create(name="lead_auditor")
-        client_group = Group.objects.create(name="client_admin")
-
-        self.cb_admin.groups.add(cb_group)
-        self.lead_auditor.groups.add(lead_group)
-        self.client_user.groups.add(client_group)
-
-        # Create profile for client
-        profile, _ = Profile.objects.get_or_create(user=self.client_user)
-        profile.organization = self.org
-        profile.save()
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage2",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=3),
-            planned_duration_hours=24.0,
-            status="draft",
-            created_by=self.cb_admin,
-            lead_auditor=self.lead_auditor,
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        [cls.client_user] = bulk_create_users([User(username="client")], password=None)
+        cls.client_user.groups.add(cls.groups["client_admin"])
+        # Link the client's profile to the organization through the user's cached profile: force_login
+        # saves last_login, and the post_save receiver would write a stale cached profile back
+        cls.client_user.profile.organization = cls.org
+        cls.client_user.profile.save(update_fields=["organization"])
+
+        cls.audit = cls.create_audit()
+        cls.url_upload = reverse("audit_management:evidence_file_upload", args=[cls.audit.pk])
+
+    def create_evidence(self):
+        """Create an evidence file uploaded by the lead auditor; the upload stream is single-use, so build it here."""
+        test_file = SimpleUploadedFile("test.pdf", b"file_content", content_type="application/pdf")
+        return EvidenceFile.objects.create(audit=self.audit, uploaded_by=self.lead_auditor, file=test_file)
 
     def test_file_upload_auditor(self):
         """Test auditor can upload evidence files."""
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.lead_auditor)
 
         # Create a test file
         test_file = SimpleUploadedFile("test.pdf", b"file_content", content_type="application/pdf")
 
         data = {"file": test_file, "finding": ""}  # General evidence
-        response = self.client.post(reverse("audit_management:evidence_file_upload", args=[self.audit.pk]), data)
+        response = self.client.post(self.url_upload, data)
         self.assertEqual(response.status_code, 302)  # Redirect after success
 
         # Check file was created
@@ -517,12 +410,12 @@ class EvidenceFileManagementTest(TestCase):
 
     def test_file_upload_client(self):
         """Test client can upload evidence files."""
-        self.client.login(username="client", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.client_user)
 
         test_file = SimpleUploadedFile("client_doc.pdf", b"client_content", content_type="application/pdf")
 
         data = {"file": test_file, "finding": ""}
-        response = self.client.post(reverse("audit_management:evidence_file_upload", args=[self.audit.pk]), data)
+        response = self.client.post(self.url_upload, data)
         self.assertEqual(response.status_code, 302)
 
         files = EvidenceFile.objects.filter(audit=self.audit)
@@ -531,30 +424,29 @@ class EvidenceFileManagementTest(TestCase):
     def test_file_download_permission(self):
         """Test file download requires proper permissions."""
         # Create evidence file
-        test_file = SimpleUploadedFile("test.pdf", b"file_content", content_type="application/pdf")
-        evidence = EvidenceFile.objects.create(audit=self.audit, uploaded_by=self.lead_auditor, file=test_file)
+        evidence = self.create_evidence()
+        url = reverse("audit_management:evidence_file_download", args=[evidence.pk])
 
         # CB Admin can download
-        self.client.login(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(reverse("audit_management:evidence_file_download", args=[evidence.pk]))
+        self.client.force_login(self.cb_admin)
+        response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
         # Lead auditor can download
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(reverse("audit_management:evidence_file_download", args=[evidence.pk]))
+        self.client.force_login(self.lead_auditor)
+        response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
         # Client can download their org's files
-        self.client.login(username="client", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(reverse("audit_management:evidence_file_download", args=[evidence.pk]))
+        self.client.force_login(self.client_user)
+        response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
     def test_file_delete_uploader(self):
         """Test uploader can delete their own files."""
-        test_file = SimpleUploadedFile("test.pdf", b"file_content", content_type="application/pdf")
-        evidence = EvidenceFile.objects.create(audit=self.audit, uploaded_by=self.lead_auditor, file=test_file)
+        evidence = self.create_evidence()
 
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.lead_auditor)
         response = self.client.post(reverse("audit_management:evidence_file_delete", args=[evidence.pk]))
         self.assertEqual(response.status_code, 302)
 
@@ -563,78 +455,55 @@ class EvidenceFileManagementTest(TestCase):
 
     def test_file_delete_cb_admin(self):
         """Test CB admin can delete any file."""
-        test_file = SimpleUploadedFile("test.pdf", b"file_content", content_type="application/pdf")
-        evidence = EvidenceFile.objects.create(audit=self.audit, uploaded_by=self.lead_auditor, file=test_file)
+        evidence = self.create_evidence()
 
-        self.client.login(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.cb_admin)
         response = self.client.post(reverse("audit_management:evidence_file_delete", args=[evidence.pk]))
         self.assertEqual(response.status_code, 302)
 
         self.assertFalse(EvidenceFile.objects.filter(pk=evidence.pk).exists())
 
 
-class StatusTransitionViewTest(TestCase):
+class StatusTransitionViewTest(AuditTestCase):
     """Test status transition view."""
 
-    def setUp(self):
-        self.client = Client()
-        self.org = Organization.objects.create(
-            name="Test Org",
-            registered_address="123 St",
-            customer_id="ORG001",
-            total_employee_count=10,
-        )
-
-        self.cb_admin = User.objects.create_user(username="cbadmin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.lead_auditor = User.objects.create_user(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-
-        cb_group = Group.objects.create(name="cb_admin")
-        lead_group = Group.objects.create(name="lead_auditor")
-
-        self.cb_admin.groups.add(cb_group)
-        self.lead_auditor.groups.add(lead_group)
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage2",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=3),
-            planned_duration_hours=24.0,
-            status="draft",
-            created_by=self.cb_admin,
-            lead_auditor=self.lead_auditor,
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.audit = cls.create_audit()
+        cls.transition_urls = {
+            status: reverse("audit_management:audit_transition_status", args=[cls.audit.pk, status])
+            for status in ("scheduled", "decided")
+        }
 
     def test_transition_draft_to_in_review(self):
         """Test transition from draft to in_review via view."""
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(
-            reverse("audit_management:audit_transition_status", args=[self.audit.pk, "scheduled"])
-        )
+        self.client.force_login(self.lead_auditor)
+        response = self.client.get(self.transition_urls["scheduled"])
         self.assertEqual(response.status_code, 302)  # Redirect
 
-        self.audit.refresh_from_db()
+        self.audit.refresh_from_db(fields=["status"])
         self.assertEqual(self.audit.status, "scheduled")
 
     def test_transition_invalid(self):
         """Test invalid transition shows error."""
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.force_login(self.lead_auditor)
         # Try to go straight to decided (invalid)
-        response = self.client.get(reverse("audit_management:audit_transition_status", args=[self.audit.pk, "decided"]))
+        response = self.client.get(self.transition_urls["decided"])
         self.assertEqual(response.status_code, 302)
 
-        self.audit.refresh_from_db()
+        self.audit.refresh_from_db(fields=["status"])
         self.assertEqual(self.audit.status, "draft")  # Should remain draft
 
     def test_transition_permission_denied(self):
         """Test transition requires proper permissions."""
         self.audit.status = "client_review"
-        self.audit.save()
+        self.audit.save(update_fields=["status"])
 
         # Lead auditor cannot make decision
-        self.client.login(username="lead", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        response = self.client.get(reverse("audit_management:audit_transition_status", args=[self.audit.pk, "decided"]))
+        self.client.force_login(self.lead_auditor)
+        response = self.client.get(self.transition_urls["decided"])
         self.assertEqual(response.status_code, 302)
 
-        self.audit.refresh_from_db()
+        self.audit.refresh_from_db(fields=["status"])
         self.assertEqual(self.audit.status, "client_review")  # Should remain
@@ -3,42 +3,38 @@ Tests for Audit Program management.
 """
 
 from django.contrib.auth.models import Group, User
-from django.test import Client, TestCase
+from django.test import TestCase
 from django.urls import reverse
 
 from audit_management.models import AuditProgram
 from core.models import Organization
-from core.test_utils import TEST_PASSWORD_DEFAULT
+from core.test_utils import bulk_add_to_groups, bulk_create_users
 
 
 class AuditProgramTests(TestCase):
     """Test Audit Program CRUD."""
 
-    def setUp(self):
-        self.client = Client()
-        self.org = Organization.objects.create(name="Test Org", customer_id="CUST-001", total_employee_count=10)
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name="Test Org", customer_id="CUST-001", total_employee_count=10)
 
-        # Create CB Admin
-        self.cb_admin = User.objects.create_user(username="cb_admin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        cb_group = Group.objects.create(name="cb_admin")
-        self.cb_admin.groups.add(cb_group)
+        cb_group, client_group = Group.objects.bulk_create([Group(name="cb_admin"), Group(name="client_admin")])
+        cls.cb_admin, cls.client_admin = bulk_create_users(
+            [User(username="cb_admin"), User(username="client_admin")], password=None
+        )
+        bulk_add_to_groups([(cls.cb_admin, cb_group), (cls.client_admin, client_group)])
 
-        # Create Client Admin
-        self.client_admin = User.objects.create_user(username="client_admin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        client_group = Group.objects.create(name="client_admin")
-        self.client_admin.groups.add(client_group)
-        # Link to profile
-        from identity.adapters.models import Profile
+        # Link to profile through the cached instance, which force_login saves again
+        # when it updates last_login
+        cls.client_admin.profile.organization = cls.org
+        cls.client_admin.profile.save(update_fields=["organization"])
 
-        # Profile might be created by signal
-        profile, _ = Profile.objects.get_or_create(user=self.client_admin)
-        profile.organization = self.org
-        profile.save()
+        cls.url_create = reverse("audit_management:program_create")
+        cls.url_list = reverse("audit_management:program_list")
 
     def test_create_program_cb_admin(self):
         """Test CB Admin can create program."""
-        self.client.login(username="cb_admin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:program_create")
+        self.client.force_login(self.cb_admin)
         data = {
             "title": "2025 Program",
             "year": 2025,
@@ -52,20 +48,16 @@ class AuditProgramTests(TestCase):
         # but the view logic tries to set it from profile. CB Admin might not have profile.
         # So this test might fail if I don't fix the view or setup profile for CB Admin.
         # Let's give CB Admin a profile with organization for this test.
-        from identity.adapters.models import Profile
-
-        profile, _ = Profile.objects.get_or_create(user=self.cb_admin)
-        profile.organization = self.org
-        profile.save()
+        self.cb_admin.profile.organization = self.org
+        self.cb_admin.profile.save(update_fields=["organization"])
 
-        response = self.client.post(url, data)
+        response = self.client.post(self.url_create, data)
         self.assertEqual(response.status_code, 302)
         self.assertTrue(AuditProgram.objects.filter(title="2025 Program").exists())
 
     def test_create_program_client_admin(self):
         """Test Client Admin can create program."""
-        self.client.login(username="client_admin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:program_create")
+        self.client.force_login(self.client_admin)
         data = {
             "title": "Client Program",
             "year": 2025,
@@ -73,18 +65,20 @@ class AuditProgramTests(TestCase):
             "objectives": "Internal objectives",
             "risks_opportunities": "Internal risks",
         }
-        response = self.client.post(url, data)
+        response = self.client.post(self.url_create, data)
         self.assertEqual(response.status_code, 302)
         program = AuditProgram.objects.get(title="Client Program")
         self.assertEqual(program.organization, self.org)
 
     def test_list_programs(self):
         """Test listing programs."""
-        AuditProgram.objects.create(
-            organization=self.org, title="Existing Program", year=2024, created_by=self.cb_admin
+        # Several rows, so a per-row organization or creator lookup would show up in the query count
+        AuditProgram.objects.bulk_create(
+            AuditProgram(organization=self.org, title=title, year=2024, created_by=self.cb_admin)
+            for title in ["Existing Program", *(f"Program {i}" for i in range(4))]
         )
-        self.client.login(username="client_admin", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:program_list")
-        response = self.client.get(url)
+        self.client.force_login(self.client_admin)
+        with self.assertNumQueries(16):
+            response = self.client.get(self.url_list)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Existing Program")
@@ -17,50 +17,100 @@ from datetime import date, timedelta
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
-from django.test import Client, TestCase
+from django.test import TestCase
 from django.urls import reverse
 
 from audit_management.forms.finding_forms import NonconformityForm
 from audit_management.models import Audit, Nonconformity, Observation
 from core.models import Certification, Organization, Standard
-from core.test_utils import TEST_PASSWORD_DEFAULT
+from core.test_utils import TEST_PASSWORD_DEFAULT, bulk_add_to_groups, bulk_create_users
 from identity.adapters.models import Profile
 from trunk.workflows.audit_workflow import AuditWorkflow
 
 User = get_user_model()
 
 
-class NonconformityFormTests(TestCase):
-    """Test NonconformityForm validation."""
+class FindingsTestCase(TestCase):
+    """
+    Base class for findings tests.
+
+    Loads the standards fixture, builds the shared organization, certification and
+    groups once per class, and provides create_audit/create_nonconformity helpers.
+    """
+
+    fixtures = ["standards.json"]
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.org = Organization.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the organization, standard, certification and groups every findings test uses."""
+        cls.org = Organization.objects.create(
             name="Test Organization",
             registered_address="123 Test St",
             customer_id="CUST-001",
             total_employee_count=10,
         )
-        # Create an auditor for the created_by and lead_auditor fields
-        self.auditor = User.objects.create_user(username="auditor_setup", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage1",
-            status="draft",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=7),
-            created_by=self.auditor,
-            lead_auditor=self.auditor,
-        )
-        self.standard = Standard.objects.create(code="ISO 9001:2015", title="Quality management systems - Requirements")
-        # Create certification and link to audit
-        self.certification = Certification.objects.create(
-            organization=self.org,
-            standard=self.standard,
+        cls.standard = Standard.objects.get(code="ISO 9001:2015")
+        cls.certification = Certification.objects.create(
+            organization=cls.org,
+            standard=cls.standard,
             certification_scope="Quality Management",
             certificate_status="active",
         )
-        self.audit.certifications.add(self.certification)
+        cls.groups = {
+            name: Group.objects.get_or_create(name=name)[0]
+            for name in ("auditor", "lead_auditor", "client", "client_user")
+        }
+
+    @classmethod
+    def create_audit(cls, **kwargs):
+        """Create an audit for the shared organization, linked to the shared certification."""
+        kwargs.setdefault("audit_type", "stage1")
+        kwargs.setdefault("total_audit_date_from", date.today())
+        kwargs.setdefault("total_audit_date_to", date.today() + timedelta(days=7))
+        audit = Audit.objects.create(organization=cls.org, **kwargs)
+        # A fresh audit has no links yet, so insert the through row directly instead of
+        # letting certifications.add() first SELECT the existing links.
+        Audit.certifications.through.objects.create(audit=audit, certification=cls.certification)
+        return audit
+
+    @classmethod
+    def create_nonconformity(cls, **kwargs):
+        """Create an open major NC on the class audit, overriding any field via kwargs."""
+        fields = {
+            "audit": cls.audit,
+            "standard": cls.standard,
+            "clause": "4.1",
+            "category": "major",
+            "objective_evidence": "Test evidence",
+            "statement_of_nc": "Test statement",
+            "auditor_explanation": "Test explanation",
+            "created_by": cls.auditor,
+            "verification_status": "open",
+        }
+        fields.update(kwargs)
+        return Nonconformity.objects.create(**fields)
+
+    @classmethod
+    def client_response(cls):
+        """Return the client response fields of an NC that has reached "client_responded"."""
+        return {
+            "client_root_cause": "Lack of training",
+            "client_correction": "Updated records",
+            "client_corrective_action": "Training program",
+            "due_date": date.today() + timedelta(days=30),
+        }
+
+
+class NonconformityFormTests(FindingsTestCase):
+    """Test NonconformityForm validation."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test fixtures shared by every test in the class."""
+        super().setUpTestData()
+        # Create an auditor for the created_by and lead_auditor fields
+        [cls.auditor] = bulk_create_users([User(username="auditor_setup")])
+        cls.audit = cls.create_audit(status="draft", created_by=cls.auditor, lead_auditor=cls.auditor)
 
     def test_form_valid_major_nc(self):
         """Test form with valid major NC data."""
@@ -85,83 +135,44 @@ class NonconformityFormTests(TestCase):
         self.assertIn("auditor_explanation", form.errors)
 
 
-class NonconformityViewTests(TestCase):
+class NonconformityViewTests(FindingsTestCase):
     """Test nonconformity CRUD views."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = Client()
-
-        # Create organization
-        self.org = Organization.objects.create(
-            name="Test Organization",
-            registered_address="123 Test St",
-            customer_id="CUST-002",
-            total_employee_count=10,
-        )
-
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test fixtures shared by every test in the class."""
+        super().setUpTestData()
         # Create users and groups
-        self.auditor = User.objects.create_user(
-            username="auditor1",
-            password=TEST_PASSWORD_DEFAULT,
-            first_name="Test",
-            last_name="Auditor",  # nosec B106
+        cls.auditor, cls.client_user, cls.regular_user = bulk_create_users(
+            [
+                User(username="auditor1", first_name="Test", last_name="Auditor"),
+                User(username="client1"),
+                User(username="regular1"),
+            ]
         )
-        self.auditor_group = Group.objects.create(name="auditor")
-        self.auditor.groups.add(self.auditor_group)
-
-        self.client_user = User.objects.create_user(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        self.client_group = Group.objects.create(name="client")
-        self.client_user.groups.add(self.client_group)
-
-        self.regular_user = User.objects.create_user(username="regular1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        bulk_add_to_groups([(cls.auditor, cls.groups["auditor"]), (cls.client_user, cls.groups["client"])])
 
         # Create audit
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage1",
-            status="draft",
-            lead_auditor=self.auditor,
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=7),
-            created_by=self.auditor,
-        )
-
-        self.standard = Standard.objects.create(code="ISO 9001:2015", title="Quality management systems - Requirements")
-        # Create certification and link to audit
-        self.certification = Certification.objects.create(
-            organization=self.org,
-            standard=self.standard,
-            certification_scope="Quality Management",
-            certificate_status="active",
-        )
-        self.audit.certifications.add(self.certification)
+        cls.audit = cls.create_audit(status="draft", lead_auditor=cls.auditor, created_by=cls.auditor)
+        cls.url_nc_create = reverse("audit_management:nonconformity_create", kwargs={"audit_pk": cls.audit.pk})
 
     def test_auditor_can_add_nc(self):
         """Test auditor can access NC add form."""
         self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_create", kwargs={"audit_pk": self.audit.pk})
-        response = self.client.get(url)
+        response = self.client.get(self.url_nc_create)
         self.assertEqual(response.status_code, 200)
 
-    def test_client_cannot_add_nc(self):
-        """Test client cannot add findings."""
-        self.client.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_create", kwargs={"audit_pk": self.audit.pk})
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 403)  # Forbidden
-
-    def test_regular_user_cannot_add_nc(self):
-        """Test regular user cannot add findings."""
-        self.client.login(username="regular1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_create", kwargs={"audit_pk": self.audit.pk})
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 403)  # Forbidden
+    def test_non_auditors_cannot_add_nc(self):
+        """Test client and regular users cannot add findings."""
+        for username in ("client1", "regular1"):
+            with self.subTest(username=username):
+                self.client.login(username=username, password=TEST_PASSWORD_DEFAULT)  # nosec B106
+                response = self.client.get(self.url_nc_create)
+                self.assertEqual(response.status_code, 403)  # Forbidden
 
     def test_add_nc_post(self):
         """Test creating NC via POST."""
         self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_create", kwargs={"audit_pk": self.audit.pk})
         data = {
             "standard": self.standard.id,
             "clause": "4.1",
@@ -170,23 +181,13 @@ class NonconformityViewTests(TestCase):
             "statement_of_nc": "Quality records not maintained",
             "auditor_explanation": "Clause 4.1 requires documented information",
         }
-        response = self.client.post(url, data)
+        response = self.client.post(self.url_nc_create, data)
         self.assertEqual(response.status_code, 302)  # Redirect on success
         self.assertTrue(Nonconformity.objects.filter(audit=self.audit, clause="4.1").exists())
 
     def test_edit_nc_by_creator(self):
         """Test NC creator can edit."""
-        nc = Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="major",
-            objective_evidence="Test evidence",
-            statement_of_nc="Test statement",
-            auditor_explanation="Test explanation",
-            created_by=self.auditor,
-            verification_status="open",
-        )
+        nc = self.create_nonconformity()
 
         self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
         url = reverse("audit_management:nonconformity_update", kwargs={"pk": nc.pk})
@@ -195,17 +196,7 @@ class NonconformityViewTests(TestCase):
 
     def test_cannot_edit_nc_after_client_response(self):
         """Test NC cannot be edited after client responds."""
-        nc = Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="major",
-            objective_evidence="Test evidence",
-            statement_of_nc="Test statement",
-            auditor_explanation="Test explanation",
-            created_by=self.auditor,
-            verification_status="client_responded",
-        )
+        nc = self.create_nonconformity(verification_status="client_responded")
 
         self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
         url = reverse("audit_management:nonconformity_update", kwargs={"pk": nc.pk})
@@ -214,17 +205,7 @@ class NonconformityViewTests(TestCase):
 
     def test_delete_nc_by_creator(self):
         """Test NC creator can delete."""
-        nc = Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="major",
-            objective_evidence="Test evidence",
-            statement_of_nc="Test statement",
-            auditor_explanation="Test explanation",
-            created_by=self.auditor,
-            verification_status="open",
-        )
+        nc = self.create_nonconformity()
 
         self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
         url = reverse("audit_management:nonconformity_delete", kwargs={"pk": nc.pk})
@@ -233,242 +214,129 @@ class NonconformityViewTests(TestCase):
         self.assertFalse(Nonconformity.objects.filter(pk=nc.pk).exists())
 
 
-class ClientResponseTests(TestCase):
+class ClientResponseTests(FindingsTestCase):
     """Test client response to nonconformities."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client_http = Client()
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test fixtures shared by every test in the class."""
+        super().setUpTestData()
+        cls.auditor, cls.client_user = bulk_create_users([User(username="auditor1"), User(username="client1")])
+        bulk_add_to_groups([(cls.auditor, cls.groups["auditor"]), (cls.client_user, cls.groups["client_user"])])
+        # Link the client's profile to the organization
+        Profile.objects.filter(user=cls.client_user).update(organization=cls.org)
 
-        self.org = Organization.objects.create(
-            name="Test Organization",
-            registered_address="123 Test St",
-            customer_id="CUST-003",
-            total_employee_count=10,
-        )
+        cls.audit = cls.create_audit(status="client_review", created_by=cls.auditor, lead_auditor=cls.auditor)
 
-        self.auditor = User.objects.create_user(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        auditor_group = Group.objects.create(name="auditor")
-        self.auditor.groups.add(auditor_group)
-
-        self.client_user = User.objects.create_user(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        client_group = Group.objects.create(name="client_user")
-        self.client_user.groups.add(client_group)
-        # Get or create profile and set organization
-        profile, _ = Profile.objects.get_or_create(user=self.client_user)
-        profile.organization = self.org
-        profile.save()
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage1",
-            status="client_review",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=7),
-            created_by=self.auditor,
-            lead_auditor=self.auditor,
-        )
-
-        self.standard = Standard.objects.create(code="ISO 9001:2015", title="Quality management systems - Requirements")
-        # Create certification and link to audit
-        self.certification = Certification.objects.create(
-            organization=self.org,
-            standard=self.standard,
-            certification_scope="Quality Management",
-            certificate_status="active",
-        )
-        self.audit.certifications.add(self.certification)
-
-        self.nc = Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="major",
-            objective_evidence="Test evidence",
-            statement_of_nc="Test statement",
-            auditor_explanation="Test explanation",
-            created_by=self.auditor,
-            verification_status="open",
-        )
+        cls.nc = cls.create_nonconformity()
+        cls.url_respond = reverse("audit_management:nonconformity_respond", kwargs={"pk": cls.nc.pk})
 
     def test_client_can_respond(self):
         """Test client can access response form."""
-        self.client_http.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_respond", kwargs={"pk": self.nc.pk})
-        response = self.client_http.get(url)
+        self.client.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        response = self.client.get(self.url_respond)
         self.assertEqual(response.status_code, 200)
 
     def test_auditor_cannot_respond(self):
         """Test auditor cannot submit client response."""
-        self.client_http.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_respond", kwargs={"pk": self.nc.pk})
-        response = self.client_http.get(url)
+        self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        response = self.client.get(self.url_respond)
         self.assertEqual(response.status_code, 403)  # Forbidden
 
     def test_client_submit_response(self):
         """Test client can submit response."""
-        self.client_http.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_respond", kwargs={"pk": self.nc.pk})
+        self.client.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
         data = {
             "client_root_cause": "Lack of training on documentation requirements",
             "client_correction": "Updated all missing records",
             "client_corrective_action": "Implemented training program for all staff",
             "due_date": (date.today() + timedelta(days=30)).isoformat(),
         }
-        response = self.client_http.post(url, data)
+        # Session and user (2), the NC and its audit (2), the client group checks (2), the profile
+        # and organization for the ownership check (3), the form's NC, standard, audit and
+        # certification standards (4), then the UPDATE
+        with self.assertNumQueries(14):
+            response = self.client.post(self.url_respond, data)
         self.assertEqual(response.status_code, 302)
 
         # Check NC status updated
-        self.nc.refresh_from_db()
+        self.nc.refresh_from_db(fields=["verification_status", "client_root_cause"])
         self.assertEqual(self.nc.verification_status, "client_responded")
         self.assertIsNotNone(self.nc.client_root_cause)
 
     def test_cannot_respond_twice(self):
         """Test cannot respond to already responded NC."""
-        self.nc.verification_status = "client_responded"
-        self.nc.save()
+        Nonconformity.objects.filter(pk=self.nc.pk).update(verification_status="client_responded")
 
-        self.client_http.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_respond", kwargs={"pk": self.nc.pk})
-        response = self.client_http.get(url)
+        self.client.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        response = self.client.get(self.url_respond)
         self.assertEqual(response.status_code, 403)  # Forbidden - already responded
 
 
-class AuditorVerificationTests(TestCase):
+class AuditorVerificationTests(FindingsTestCase):
     """Test auditor verification of client responses."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client_http = Client()
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test fixtures shared by every test in the class."""
+        super().setUpTestData()
+        cls.auditor, cls.client_user = bulk_create_users([User(username="auditor1"), User(username="client1")])
+        bulk_add_to_groups([(cls.auditor, cls.groups["auditor"]), (cls.client_user, cls.groups["client_user"])])
+        # Link the client's profile to the organization
+        Profile.objects.filter(user=cls.client_user).update(organization=cls.org)
 
-        self.org = Organization.objects.create(
-            name="Test Organization",
-            registered_address="123 Test St",
-            customer_id="CUST-004",
-            total_employee_count=10,
-        )
+        cls.audit = cls.create_audit(status="client_review", created_by=cls.auditor, lead_auditor=cls.auditor)
 
-        self.auditor = User.objects.create_user(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        auditor_group = Group.objects.create(name="auditor")
-        self.auditor.groups.add(auditor_group)
-
-        self.client_user = User.objects.create_user(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        client_group = Group.objects.create(name="client_user")
-        self.client_user.groups.add(client_group)
-        # Get or create profile and set organization
-        profile, _ = Profile.objects.get_or_create(user=self.client_user)
-        profile.organization = self.org
-        profile.save()
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage1",
-            status="client_review",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=7),
-            created_by=self.auditor,
-            lead_auditor=self.auditor,
-        )
-
-        self.standard = Standard.objects.create(code="ISO 9001:2015", title="Quality management systems - Requirements")
-        # Create certification and link to audit
-        self.certification = Certification.objects.create(
-            organization=self.org,
-            standard=self.standard,
-            certification_scope="Quality Management",
-            certificate_status="active",
-        )
-        self.audit.certifications.add(self.certification)
-
-        self.nc = Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="major",
-            objective_evidence="Test evidence",
-            statement_of_nc="Test statement",
-            auditor_explanation="Test explanation",
-            created_by=self.auditor,
-            verification_status="client_responded",
-            client_root_cause="Lack of training",
-            client_correction="Updated records",
-            client_corrective_action="Training program",
-            due_date=date.today() + timedelta(days=30),
-        )
+        cls.nc = cls.create_nonconformity(verification_status="client_responded", **cls.client_response())
+        cls.url_verify = reverse("audit_management:nonconformity_verify", kwargs={"pk": cls.nc.pk})
 
     def test_auditor_can_verify(self):
         """Test auditor can access verification form."""
-        self.client_http.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_verify", kwargs={"pk": self.nc.pk})
-        response = self.client_http.get(url)
+        self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        response = self.client.get(self.url_verify)
         self.assertEqual(response.status_code, 200)
 
     def test_client_cannot_verify(self):
         """Test client cannot verify responses."""
-        self.client_http.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_verify", kwargs={"pk": self.nc.pk})
-        response = self.client_http.get(url)
+        self.client.login(username="client1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        response = self.client.get(self.url_verify)
         self.assertEqual(response.status_code, 403)  # Forbidden
 
     def test_auditor_accept_response(self):
         """Test auditor can accept response."""
-        self.client_http.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        url = reverse("audit_management:nonconformity_verify", kwargs={"pk": self.nc.pk})
+        self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
         data = {
             "verification_action": "accept",
             "verification_notes": "Corrective action plan is acceptable",
         }
-        response = self.client_http.post(url, data)
+        # Session and user (2), the NC and its audit (2), the auditor group checks (2), the audit's
+        # lead auditor (1), the form's NC, standard, audit and certification standards (4), then the UPDATE
+        with self.assertNumQueries(12):
+            response = self.client.post(self.url_verify, data)
         self.assertEqual(response.status_code, 302)
 
         # Check NC status updated
-        self.nc.refresh_from_db()
+        self.nc.refresh_from_db(fields=["verification_status", "verified_by", "verified_at"])
         self.assertEqual(self.nc.verification_status, "accepted")
         self.assertIsNotNone(self.nc.verified_by)
         self.assertIsNotNone(self.nc.verified_at)
 
 
-class ObservationViewTests(TestCase):
+class ObservationViewTests(FindingsTestCase):
     """Test observation CRUD views."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client_http = Client()
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test fixtures shared by every test in the class."""
+        super().setUpTestData()
+        [cls.auditor] = bulk_create_users([User(username="auditor1")])
+        cls.auditor.groups.add(cls.groups["auditor"])
 
-        self.org = Organization.objects.create(
-            name="Test Organization",
-            registered_address="123 Test St",
-            customer_id="CUST-005",
-            total_employee_count=10,
-        )
-
-        self.auditor = User.objects.create_user(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        auditor_group = Group.objects.create(name="auditor")
-        self.auditor.groups.add(auditor_group)
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage1",
-            status="draft",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=7),
-            created_by=self.auditor,
-            lead_auditor=self.auditor,
-        )
-
-        self.standard = Standard.objects.create(code="ISO 9001:2015", title="Quality management systems - Requirements")
-        # Create certification and link to audit
-        self.certification = Certification.objects.create(
-            organization=self.org,
-            standard=self.standard,
-            certification_scope="Quality Management",
-            certificate_status="active",
-        )
-        self.audit.certifications.add(self.certification)
+        cls.audit = cls.create_audit(status="draft", created_by=cls.auditor, lead_auditor=cls.auditor)
 
     def test_add_observation(self):
         """Test creating observation."""
-        self.client_http.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
+        self.client.login(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
         url = reverse("audit_management:observation_create", kwargs={"audit_pk": self.audit.pk})
         data = {
             "standard": self.standard.id,
@@ -476,46 +344,22 @@ class ObservationViewTests(TestCase):
             "statement": "Documentation could be improved",
             "explanation": "While compliant, better organization would help",
         }
-        response = self.client_http.post(url, data)
+        response = self.client.post(url, data)
         self.assertEqual(response.status_code, 302)
         self.assertTrue(Observation.objects.filter(audit=self.audit, clause="4.2").exists())
 
 
-class WorkflowIntegrationTests(TestCase):
+class WorkflowIntegrationTests(FindingsTestCase):
     """Test workflow integration with findings."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.org = Organization.objects.create(
-            name="Test Organization",
-            registered_address="123 Test St",
-            customer_id="CUST-006",
-            total_employee_count=10,
-        )
-
-        self.auditor = User.objects.create_user(username="auditor1", password=TEST_PASSWORD_DEFAULT)  # nosec B106
-        lead_auditor_group = Group.objects.create(name="lead_auditor")
-        self.auditor.groups.add(lead_auditor_group)
-
-        self.audit = Audit.objects.create(
-            organization=self.org,
-            audit_type="stage1",
-            status="scheduled",
-            lead_auditor=self.auditor,
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=7),
-            created_by=self.auditor,
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test fixtures shared by every test in the class."""
+        super().setUpTestData()
+        [cls.auditor] = bulk_create_users([User(username="auditor1")])
+        cls.auditor.groups.add(cls.groups["lead_auditor"])
 
-        self.standard = Standard.objects.create(code="ISO 9001:2015", title="Quality management systems - Requirements")
-        # Create certification and link to audit
-        self.certification = Certification.objects.create(
-            organization=self.org,
-            standard=self.standard,
-            certification_scope="Quality Management",
-            certificate_status="active",
-        )
-        self.audit.certifications.add(self.certification)
+        cls.audit = cls.create_audit(status="scheduled", lead_auditor=cls.auditor, created_by=cls.auditor)
 
     def test_cannot_submit_with_open_major_nc(self):
         """Test workflow allows sending report to client with open major NCs (ISO 17021-1)."""
@@ -524,17 +368,7 @@ class WorkflowIntegrationTests(TestCase):
         self.audit.save()
 
         # Create open major NC
-        Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="major",
-            objective_evidence="Test evidence",
-            statement_of_nc="Test statement",
-            auditor_explanation="Test explanation",
-            created_by=self.auditor,
-            verification_status="open",
-        )
+        self.create_nonconformity()
 
         workflow = AuditWorkflow(self.audit)
         can_transition = workflow.can_transition_to("client_review")
@@ -549,21 +383,7 @@ class WorkflowIntegrationTests(TestCase):
         self.audit.save()
 
         # Create major NC with client response
-        Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="major",
-            objective_evidence="Test evidence",
-            statement_of_nc="Test statement",
-            auditor_explanation="Test explanation",
-            created_by=self.auditor,
-            verification_status="client_responded",
-            client_root_cause="Lack of training",
-            client_correction="Updated records",
-            client_corrective_action="Training program",
-            due_date=date.today() + timedelta(days=30),
-        )
+        self.create_nonconformity(verification_status="client_responded", **self.client_response())
 
         workflow = AuditWorkflow(self.audit)
         can_transition = workflow.can_transition_to("client_review")
@@ -577,17 +397,7 @@ class WorkflowIntegrationTests(TestCase):
         self.audit.save()
 
         # Create minor NC (open is OK)
-        Nonconformity.objects.create(
-            audit=self.audit,
-            standard=self.standard,
-            clause="4.1",
-            category="minor",
-            objective_evidence="Test evidence",
-            statement_of_nc="Test statement",
-            auditor_explanation="Test explanation",
-            created_by=self.auditor,
-            verification_status="open",
-        )
+        self.create_nonconformity(category="minor")
 
         workflow = AuditWorkflow(self.audit)
         can_transition = workflow.can_transition_to("client_review")
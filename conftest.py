@@ -10,6 +10,16 @@ os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
 os.environ.pop("DATABASE_URL", None)
 
 
+def pytest_configure(config):  # pylint: disable=unused-argument
+    """
+    Hash test passwords with MD5 instead of PBKDF2.
+    Applied at configure time (not as a settings fixture) so it also covers setUpTestData.
+    """
+    from django.conf import settings
+
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
 @pytest.fixture(autouse=True)
 def enable_celery_always_eager(settings):
     """
@@ -2,4 +2,52 @@
 Test utilities and constants.
 """
 
+from contextlib import contextmanager
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
+from identity.adapters.models import Profile
+
 TEST_PASSWORD_DEFAULT = "TestPassword123!"  # nosec
+
+
+def bulk_create_users(users, password=TEST_PASSWORD_DEFAULT):
+    """
+    Create unsaved users with a single INSERT, hashing the shared password once.
+
+    bulk_create() does not send post_save, so the profiles normally created by
+    the create_user_profile receiver are bulk-created here as well.
+    """
+    password_hash = make_password(password)
+    for user in users:
+        user.password = password_hash
+    users = get_user_model().objects.bulk_create(users)
+    Profile.objects.bulk_create([Profile(user=user) for user in users])
+    return users
+
+
+def bulk_add_to_groups(memberships):
+    """Insert (user, group) memberships into the auth through table with a single INSERT."""
+    membership = get_user_model().groups.through
+    membership.objects.bulk_create([membership(user=user, group=group) for user, group in memberships])
+
+
+@contextmanager
+def mute_signals(*signals):
+    """
+    Disconnect every receiver of the given signals for the duration of the block.
+
+    Use for fixture rows whose receivers' side effects (such as profile creation
+    on post_save) the test does not need.
+    """
+    saved = [(signal, signal.receivers) for signal in signals]
+    try:
+        for signal in signals:
+            signal.receivers = []
+            signal.sender_receivers_cache.clear()
+        yield
+    finally:
+        for signal, receivers in saved:
+            signal.receivers = receivers
+            signal.sender_receivers_cache.clear()
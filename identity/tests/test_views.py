@@ -22,17 +22,17 @@ class TestDashboardViews:
 
     @pytest.fixture
     def cb_admin_group(self):
-        group, _ = Group.objects.get_or_create(name="cb_admin")
+        group = Group.objects.create(name="cb_admin")
         return group
 
     @pytest.fixture
     def auditor_group(self):
-        group, _ = Group.objects.get_or_create(name="lead_auditor")
+        group = Group.objects.create(name="lead_auditor")
         return group
 
     @pytest.fixture
     def client_group(self):
-        group, _ = Group.objects.get_or_create(name="client_admin")
+        group = Group.objects.create(name="client_admin")
         return group
 
     @pytest.fixture
@@ -136,7 +136,7 @@ class TestAuditorManagementViews:
 
     @pytest.fixture
     def cb_admin_group(self):
-        group, _ = Group.objects.get_or_create(name="cb_admin")
+        group = Group.objects.create(name="cb_admin")
         return group
 
     @pytest.fixture
@@ -148,7 +148,7 @@ class TestAuditorManagementViews:
     @pytest.fixture
     def auditor_user(self):
         user = User.objects.create_user(username="auditor", password="password")
-        group, _ = Group.objects.get_or_create(name="lead_auditor")
+        group = Group.objects.create(name="lead_auditor")
         user.groups.add(group)
         return user
 
@@ -1,35 +1,74 @@
+from contextlib import contextmanager
+
+from django.db import models
+
+
 class PermissionPredicate:
     """Centralized permission checking for role-based access control."""
 
+    @staticmethod
+    @contextmanager
+    def cached_groups(user):
+        """
+        Memoize the user's group names for the duration of the block.
+
+        Predicates evaluated inside the block answer from one frozenset instead of
+        issuing a membership query each. Only saved model instances are memoized;
+        unsaved users, mocks and anonymous users keep the per-call queries. Nested
+        blocks reuse the outer cache and leave it in place.
+        """
+        if (
+            not isinstance(user, models.Model)
+            or user.pk is None
+            or isinstance(getattr(user, "_cached_groups", None), frozenset)
+        ):
+            yield
+            return
+        user._cached_groups = frozenset(user.groups.values_list("name", flat=True))
+        try:
+            yield
+        finally:
+            del user._cached_groups
+
+    @staticmethod
+    def _in_groups(user, *names):
+        """Check membership against the memoized group names, falling back to a query."""
+        cached = getattr(user, "_cached_groups", None)
+        if isinstance(cached, frozenset):
+            return not cached.isdisjoint(names)
+        if len(names) == 1:
+            return user.groups.filter(name=names[0]).exists()
+        return user.groups.filter(name__in=list(names)).exists()
+
     @staticmethod
     def is_cb_admin(user):
         """Check if user is a Certification Body Administrator."""
-        return user.groups.filter(name="cb_admin").exists()
+        return PermissionPredicate._in_groups(user, "cb_admin")
 
     @staticmethod
     def is_lead_auditor(user):
         """Check if user is a Lead Auditor."""
-        return user.groups.filter(name="lead_auditor").exists()
+        return PermissionPredicate._in_groups(user, "lead_auditor")
 
     @staticmethod
     def is_auditor(user):
         """Check if user is an Auditor or Lead Auditor."""
-        return user.groups.filter(name__in=["lead_auditor", "auditor"]).exists()
+        return PermissionPredicate._in_groups(user, "lead_auditor", "auditor")
 
     @staticmethod
     def is_client_user(user):
         """Check if user is a Client Administrator or Client User."""
-        return user.groups.filter(name__in=["client_admin", "client_user"]).exists()
+        return PermissionPredicate._in_groups(user, "client_admin", "client_user")
 
     @staticmethod
     def is_technical_reviewer(user):
         """Check if user can conduct technical reviews (ISO 17021 Clause 9.5)"""
-        return user.groups.filter(name="technical_reviewer").exists()
+        return PermissionPredicate._in_groups(user, "technical_reviewer")
 
     @staticmethod
     def is_decision_maker(user):
         """Check if user can make certification decisions (ISO 17021 Clause 9.6)"""
-        return user.groups.filter(name="decision_maker").exists()
+        return PermissionPredicate._in_groups(user, "decision_maker")
 
     @staticmethod
     def can_conduct_technical_review(user):
@@ -9,6 +9,7 @@ Operated by an Organization with Multiple Sites
 """
 
 import math
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 
@@ -47,16 +48,37 @@ def calculate_sample_size(
     Raises:
         ValueError: If total_sites < 1
     """
+    result = _calculate_sample_size(
+        total_sites, high_risk_sites, previous_findings_count, is_initial_certification, scope_variation
+    )
+    # The cached dict is shared between calls, so callers get their own lists to mutate
+    return {
+        **result,
+        "risk_factors": list(result["risk_factors"]),
+        "recommended_sites": list(result["recommended_sites"]),
+    }
+
+
+@lru_cache(maxsize=1024)
+def _calculate_sample_size(
+    total_sites: int,
+    high_risk_sites: int,
+    previous_findings_count: int,
+    is_initial_certification: bool,
+    scope_variation: str,
+) -> Dict[str, Any]:
+    """Memoized body of calculate_sample_size, which is a pure function of its arguments."""
     if total_sites < 1:
         raise ValueError("Total sites must be at least 1")
 
     # IAF MD1 base calculation
     if is_initial_certification:
         # Stage 1 and Stage 2: y = √x
-        base_sample = math.ceil(math.sqrt(total_sites))
+        base_sample = _ceil_sqrt(total_sites)
     else:
-        # Surveillance audits: y = √x - 0.5 (minimum 1)
-        base_sample = max(1, math.ceil(math.sqrt(total_sites) - 0.5))
+        # Surveillance audits: y = √x - 0.5 (minimum 1). ⌈√x - 0.5⌉ is the smallest k with
+        # (2k + 1)² ≥ 4x, which is ⌈√(4x)⌉ // 2 since 4x is never an odd square
+        base_sample = max(1, _ceil_sqrt(4 * total_sites) // 2)
 
     # Risk-based adjustments
     risk_adjustment, risk_factors = _calculate_risk_adjustments(
@@ -110,6 +132,12 @@ def calculate_sample_size(
     }
 
 
+def _ceil_sqrt(n: int) -> int:
+    """Return ⌈√n⌉ using integer arithmetic, so perfect squares never round up."""
+    root = math.isqrt(n)
+    return root if root * root == n else root + 1
+
+
 def _calculate_risk_adjustments(
     base_sample: int, high_risk_sites: int, previous_findings_count: int, scope_variation: str
 ) -> Tuple[int, List[str]]:
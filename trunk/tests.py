@@ -7,8 +7,9 @@ Tests for:
 - trunk/events/dispatcher.py
 """
 
+from collections import defaultdict
 from datetime import date, timedelta
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from django.contrib.auth.models import Group, User
 from django.test import TestCase
@@ -330,10 +331,16 @@ class EventHandlersTest(TestCase):
             created_by=self.user,
         )
 
+    def record_events(self, event_type):
+        """Collect payloads of event_type on the global dispatcher for this test only."""
+        events = []
+        event_dispatcher.register(event_type, events.append)
+        self.addCleanup(event_dispatcher.unregister, event_type, events.append)
+        return events
+
     def test_on_audit_status_changed_to_client_review(self):
         """Test handler for status change to client_review."""
-        events = []
-        event_dispatcher.register(EventType.AUDIT_SUBMITTED_TO_CLIENT, events.append)
+        events = self.record_events(EventType.AUDIT_SUBMITTED_TO_CLIENT)
 
         on_audit_status_changed(
             {"audit_id": self.audit.id, "new_status": "client_review", "changed_by_id": self.user.id}
@@ -344,8 +351,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_audit_status_changed_to_submitted(self):
         """Test handler for status change to submitted."""
-        events = []
-        event_dispatcher.register(EventType.AUDIT_SUBMITTED_TO_CB, events.append)
+        events = self.record_events(EventType.AUDIT_SUBMITTED_TO_CB)
 
         on_audit_status_changed({"audit_id": self.audit.id, "new_status": "submitted", "changed_by_id": self.user.id})
 
@@ -354,8 +360,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_audit_status_changed_to_decided(self):
         """Test handler for status change to decided."""
-        events = []
-        event_dispatcher.register(EventType.AUDIT_DECIDED, events.append)
+        events = self.record_events(EventType.AUDIT_DECIDED)
 
         on_audit_status_changed({"audit_id": self.audit.id, "new_status": "decided", "changed_by_id": self.user.id})
 
@@ -363,8 +368,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_audit_status_changed_missing_audit(self):
         """Test handler with missing audit returns early."""
-        events = []
-        event_dispatcher.register(EventType.AUDIT_SUBMITTED_TO_CLIENT, events.append)
+        events = self.record_events(EventType.AUDIT_SUBMITTED_TO_CLIENT)
 
         on_audit_status_changed({"new_status": "client_review", "changed_by_id": self.user.id})
 
@@ -372,8 +376,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_audit_status_changed_missing_status(self):
         """Test handler with missing status returns early."""
-        events = []
-        event_dispatcher.register(EventType.AUDIT_SUBMITTED_TO_CLIENT, events.append)
+        events = self.record_events(EventType.AUDIT_SUBMITTED_TO_CLIENT)
 
         on_audit_status_changed({"audit_id": self.audit.id, "changed_by_id": self.user.id})
 
@@ -381,8 +384,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_nc_verified_accepted(self):
         """Test handler for NC verification accepted."""
-        events = []
-        event_dispatcher.register(EventType.NC_VERIFIED_ACCEPTED, events.append)
+        events = self.record_events(EventType.NC_VERIFIED_ACCEPTED)
 
         from audit_management.models import Nonconformity
 
@@ -403,8 +405,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_nc_verified_rejected(self):
         """Test handler for NC verification rejected."""
-        events = []
-        event_dispatcher.register(EventType.NC_VERIFIED_REJECTED, events.append)
+        events = self.record_events(EventType.NC_VERIFIED_REJECTED)
 
         from audit_management.models import Nonconformity
 
@@ -424,8 +425,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_nc_verified_closed(self):
         """Test handler for NC closed."""
-        events = []
-        event_dispatcher.register(EventType.NC_CLOSED, events.append)
+        events = self.record_events(EventType.NC_CLOSED)
 
         from audit_management.models import Nonconformity
 
@@ -445,8 +445,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_nc_verified_missing_nc(self):
         """Test handler with missing NC returns early."""
-        events = []
-        event_dispatcher.register(EventType.NC_VERIFIED_ACCEPTED, events.append)
+        events = self.record_events(EventType.NC_VERIFIED_ACCEPTED)
 
         on_nc_verified({"verification_status": "accepted"})
 
@@ -454,8 +453,7 @@ class EventHandlersTest(TestCase):
 
     def test_on_nc_verified_missing_status(self):
         """Test handler with missing status returns early."""
-        events = []
-        event_dispatcher.register(EventType.NC_VERIFIED_ACCEPTED, events.append)
+        events = self.record_events(EventType.NC_VERIFIED_ACCEPTED)
 
         from audit_management.models import Nonconformity
 
@@ -521,14 +519,12 @@ class EventHandlersTest(TestCase):
 
     def test_register_event_handlers(self):
         """Test that register_event_handlers registers all handlers."""
-        # Clear existing handlers
-        event_dispatcher.clear()
-
-        # Register handlers
-        register_event_handlers()
+        # Register into an empty handler table; the app's handlers come back afterwards
+        with patch.object(event_dispatcher, "_handlers", defaultdict(list)):
+            register_event_handlers()
 
-        # Verify handlers are registered
-        self.assertTrue(len(event_dispatcher._handlers) > 0)
+            # Verify handlers are registered
+            self.assertTrue(len(event_dispatcher._handlers) > 0)
 
 
 # ==============================================================================
@@ -542,7 +538,6 @@ class EventDispatcherTest(TestCase):
     def setUp(self):
         """Set up fresh dispatcher."""
         self.dispatcher = EventDispatcher()
-        self.events_received = []
 
     @patch("trunk.events.tasks.dispatch_event_task.delay")
     def test_emit_queues_task(self, mock_delay):
@@ -552,42 +547,34 @@ class EventDispatcherTest(TestCase):
 
     def test_register_and_dispatch_sync(self):
         """Test basic register and synchronous dispatch."""
-
-        def handler(payload):
-            self.events_received.append(payload)
+        handler = MagicMock()
 
         self.dispatcher.register(EventType.AUDIT_CREATED, handler)
         self.dispatcher.dispatch_sync(EventType.AUDIT_CREATED, {"test": "data"})
 
-        self.assertEqual(len(self.events_received), 1)
-        self.assertEqual(self.events_received[0]["test"], "data")
+        handler.assert_called_once_with({"test": "data"})
 
     def test_multiple_handlers(self):
         """Test multiple handlers for same event."""
-
-        def handler1(payload):
-            self.events_received.append(("h1", payload))
-
-        def handler2(payload):
-            self.events_received.append(("h2", payload))
+        handler1 = MagicMock()
+        handler2 = MagicMock()
 
         self.dispatcher.register(EventType.AUDIT_CREATED, handler1)
         self.dispatcher.register(EventType.AUDIT_CREATED, handler2)
         self.dispatcher.dispatch_sync(EventType.AUDIT_CREATED, {"test": "data"})
 
-        self.assertEqual(len(self.events_received), 2)
+        handler1.assert_called_once_with({"test": "data"})
+        handler2.assert_called_once_with({"test": "data"})
 
     def test_clear(self):
         """Test clearing handlers."""
-
-        def handler(payload):
-            self.events_received.append(payload)
+        handler = MagicMock()
 
         self.dispatcher.register(EventType.AUDIT_CREATED, handler)
         self.dispatcher.clear()
         self.dispatcher.dispatch_sync(EventType.AUDIT_CREATED, {"test": "data"})
 
-        self.assertEqual(len(self.events_received), 0)
+        handler.assert_not_called()
 
     def test_dispatch_sync_no_handlers(self):
         """Test dispatch_sync with no handlers doesn't error."""
@@ -596,12 +583,8 @@ class EventDispatcherTest(TestCase):
 
     def test_handler_exception_logged(self):
         """Test handler exceptions are logged but don't stop other handlers."""
-
-        def bad_handler(payload):
-            raise ValueError("Test error")
-
-        def good_handler(payload):
-            self.events_received.append(payload)
+        bad_handler = MagicMock(side_effect=ValueError("Test error"))
+        good_handler = MagicMock()
 
         self.dispatcher.register(EventType.AUDIT_CREATED, bad_handler)
         self.dispatcher.register(EventType.AUDIT_CREATED, good_handler)
@@ -609,7 +592,7 @@ class EventDispatcherTest(TestCase):
         # Should not raise, and good handler should still be called
         self.dispatcher.dispatch_sync(EventType.AUDIT_CREATED, {"test": "data"})
 
-        self.assertEqual(len(self.events_received), 1)
+        good_handler.assert_called_once_with({"test": "data"})
 
     def tearDown(self):
         """Clean up."""
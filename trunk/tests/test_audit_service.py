@@ -1,9 +1,9 @@
 from datetime import date, timedelta
 from unittest.mock import patch
 
-import pytest
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.test import TestCase
 
 from audit_management.models import Audit
 from core.models import Certification, Organization, Site, Standard
@@ -11,37 +11,46 @@ from trunk.events import EventType
 from trunk.services.audit_service import AuditService
 
 
-@pytest.mark.django_db
-class TestAuditService:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        self.user = User.objects.create_user(username="test_user", password="password")
-        self.org = Organization.objects.create(
+class TestAuditService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # None of these rows are mutated by the service calls, so they are built once per class
+        cls.user = User.objects.create_user(username="test_user", password="password")
+        cls.org = Organization.objects.create(
             name="Test Org",
             registered_address="123 Test St",
             customer_id="TEST001",
             total_employee_count=10,
         )
-        self.site = Site.objects.create(
-            organization=self.org,
+        cls.site = Site.objects.create(
+            organization=cls.org,
             site_name="Test Site",
             site_address="123 Test St",
             site_employee_count=10,
         )
-        self.standard = Standard.objects.create(code="ISO 9001", title="Quality Management")
-        self.cert = Certification.objects.create(
-            organization=self.org,
-            standard=self.standard,
+        cls.standard = Standard.objects.create(code="ISO 9001", title="Quality Management")
+        cls.cert = Certification.objects.create(
+            organization=cls.org,
+            standard=cls.standard,
             certificate_id="CERT001",
             certificate_status="active",
         )
 
+        cls.today = date.today()
+        cls.draft_audit_fields = {
+            "audit_type": "stage1",
+            "status": "draft",
+            "total_audit_date_from": cls.today,
+            "total_audit_date_to": cls.today,
+            "planned_duration_hours": 8,
+        }
+
     @patch("trunk.services.audit_service.event_dispatcher.emit")
     def test_create_audit_success(self, mock_emit):
         audit_data = {
             "audit_type": "surveillance",
-            "total_audit_date_from": date.today(),
-            "total_audit_date_to": date.today() + timedelta(days=2),
+            "total_audit_date_from": self.today,
+            "total_audit_date_to": self.today + timedelta(days=2),
             "planned_duration_hours": 16,
             "status": "draft",
         }
@@ -54,10 +63,10 @@ class TestAuditService:
             created_by=self.user,
         )
 
-        assert audit.organization == self.org
-        assert audit.created_by == self.user
-        assert audit.certifications.count() == 1
-        assert audit.sites.count() == 1
+        self.assertEqual(audit.organization, self.org)
+        self.assertEqual(audit.created_by, self.user)
+        self.assertEqual(audit.certifications.count(), 1)
+        self.assertEqual(audit.sites.count(), 1)
 
         mock_emit.assert_called_with(EventType.AUDIT_CREATED, {"audit_id": audit.id, "created_by_id": self.user.id})
 
@@ -65,11 +74,11 @@ class TestAuditService:
         audit_data = {
             "audit_type": "surveillance",
             # Missing planned_duration_hours for surveillance audit
-            "total_audit_date_from": date.today(),
-            "total_audit_date_to": date.today() + timedelta(days=2),
+            "total_audit_date_from": self.today,
+            "total_audit_date_to": self.today + timedelta(days=2),
         }
 
-        with pytest.raises(ValidationError) as exc:
+        with self.assertRaises(ValidationError) as exc:
             AuditService.create_audit(
                 organization=self.org,
                 certifications=[self.cert],
@@ -77,17 +86,17 @@ class TestAuditService:
                 audit_data=audit_data,
                 created_by=self.user,
             )
-        assert "must have planned duration specified" in str(exc.value)
+        self.assertIn("must have planned duration specified", str(exc.exception))
 
     def test_create_audit_date_validation(self):
         audit_data = {
             "audit_type": "stage1",
             "planned_duration_hours": 8,
-            "total_audit_date_from": date.today() + timedelta(days=5),
-            "total_audit_date_to": date.today(),  # End date before start date
+            "total_audit_date_from": self.today + timedelta(days=5),
+            "total_audit_date_to": self.today,  # End date before start date
         }
 
-        with pytest.raises(ValidationError) as exc:
+        with self.assertRaises(ValidationError) as exc:
             AuditService.create_audit(
                 organization=self.org,
                 certifications=[self.cert],
@@ -95,19 +104,11 @@ class TestAuditService:
                 audit_data=audit_data,
                 created_by=self.user,
             )
-        assert "Audit end date must be on or after start date" in str(exc.value)
+        self.assertIn("Audit end date must be on or after start date", str(exc.exception))
 
     @patch("trunk.services.audit_service.event_dispatcher.emit")
     def test_update_audit(self, mock_emit):
-        audit = Audit.objects.create(
-            organization=self.org,
-            created_by=self.user,
-            audit_type="stage1",
-            status="draft",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today(),
-            planned_duration_hours=8,
-        )
+        audit = Audit.objects.create(organization=self.org, created_by=self.user, **self.draft_audit_fields)
 
         update_data = {
             "planned_duration_hours": 12,
@@ -116,7 +117,7 @@ class TestAuditService:
 
         updated_audit = AuditService.update_audit(audit, update_data)
 
-        assert updated_audit.planned_duration_hours == 12
+        self.assertEqual(updated_audit.planned_duration_hours, 12)
 
         # Should emit AUDIT_UPDATED but not AUDIT_STATUS_CHANGED
         mock_emit.assert_called_with(
@@ -125,49 +126,33 @@ class TestAuditService:
 
     @patch("trunk.services.audit_service.event_dispatcher.emit")
     def test_update_audit_status_change(self, mock_emit):
-        audit = Audit.objects.create(
-            organization=self.org,
-            created_by=self.user,
-            audit_type="stage1",
-            status="draft",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today(),
-            planned_duration_hours=8,
-        )
+        audit = Audit.objects.create(organization=self.org, created_by=self.user, **self.draft_audit_fields)
 
         update_data = {"status": "planned"}
 
         updated_audit = AuditService.update_audit(audit, update_data)
 
-        assert updated_audit.status == "planned"
+        self.assertEqual(updated_audit.status, "planned")
 
         # Should emit both events
-        assert mock_emit.call_count == 2
+        self.assertEqual(mock_emit.call_count, 2)
 
     def test_validate_future_dates(self):
         audit_data = {
             "audit_type": "stage1",
             "planned_duration_hours": 8,
-            "total_audit_date_from": date.today() + timedelta(days=400),  # > 1 year
-            "total_audit_date_to": date.today() + timedelta(days=402),
+            "total_audit_date_from": self.today + timedelta(days=400),  # > 1 year
+            "total_audit_date_to": self.today + timedelta(days=402),
         }
 
-        with pytest.raises(ValidationError) as exc:
+        with self.assertRaises(ValidationError) as exc:
             AuditService._validate_audit_data(audit_data)
-        assert "cannot be more than 1 year in the future" in str(exc.value)
+        self.assertIn("cannot be more than 1 year in the future", str(exc.exception))
 
     @patch("trunk.services.audit_service.AuditStateMachine")
     @patch("trunk.services.audit_service.event_dispatcher.emit")
     def test_transition_status(self, mock_emit, MockSM):
-        audit = Audit.objects.create(
-            organization=self.org,
-            created_by=self.user,
-            audit_type="stage1",
-            status="draft",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today(),
-            planned_duration_hours=8,
-        )
+        audit = Audit.objects.create(organization=self.org, created_by=self.user, **self.draft_audit_fields)
 
         mock_sm_instance = MockSM.return_value
 
@@ -194,19 +179,11 @@ class TestAuditService:
 
     @patch("trunk.services.audit_service.AuditStateMachine")
     def test_get_available_transitions(self, MockSM):
-        audit = Audit.objects.create(
-            organization=self.org,
-            created_by=self.user,
-            audit_type="stage1",
-            status="draft",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today(),
-            planned_duration_hours=8,
-        )
+        audit = Audit.objects.create(organization=self.org, created_by=self.user, **self.draft_audit_fields)
         mock_sm_instance = MockSM.return_value
         mock_sm_instance.available_transitions.return_value = [("scheduled", "Schedule Audit")]
 
         transitions = AuditService.get_available_transitions(audit, self.user)
 
-        assert transitions == [("scheduled", "Schedule Audit")]
+        self.assertEqual(transitions, [("scheduled", "Schedule Audit")])
         mock_sm_instance.available_transitions.assert_called_with(self.user)
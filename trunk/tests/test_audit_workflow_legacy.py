@@ -59,16 +59,16 @@ class TestAuditWorkflowLegacy:
 
     def test_validate_report_draft_success(self):
         self.audit.status = "in_progress"
-        self.audit.nonconformity_set.count.return_value = 1
-        self.audit.observation_set.count.return_value = 0
-        self.audit.opportunityforimprovement_set.count.return_value = 0
+        self.audit.nonconformity_set.exists.return_value = True
+        self.audit.observation_set.exists.return_value = False
+        self.audit.opportunityforimprovement_set.exists.return_value = False
         self.workflow.validate_transition("report_draft")
 
     def test_validate_report_draft_fail(self):
         self.audit.status = "in_progress"
-        self.audit.nonconformity_set.count.return_value = 0
-        self.audit.observation_set.count.return_value = 0
-        self.audit.opportunityforimprovement_set.count.return_value = 0
+        self.audit.nonconformity_set.exists.return_value = False
+        self.audit.observation_set.exists.return_value = False
+        self.audit.opportunityforimprovement_set.exists.return_value = False
         with pytest.raises(ValidationError, match="without at least one finding"):
             self.workflow.validate_transition("report_draft")
 
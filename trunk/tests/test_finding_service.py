@@ -21,96 +21,46 @@ class TestFindingService:
         user.id = 101
         return user
 
-    @patch("trunk.services.finding_service.Nonconformity")
+    @pytest.fixture
+    def mock_nc(self, mock_audit):
+        nc = MagicMock()
+        nc.id = 201
+        nc.audit = mock_audit
+        return nc
+
+    @pytest.mark.parametrize(
+        ("model_name", "create", "finding_type", "extra_kwargs"),
+        [
+            ("Nonconformity", FindingService.create_nonconformity, "nonconformity", {"verification_status": "open"}),
+            ("Observation", FindingService.create_observation, "observation", {}),
+            ("OpportunityForImprovement", FindingService.create_ofi, "ofi", {}),
+        ],
+    )
     @patch("trunk.services.finding_service.event_dispatcher")
-    def test_create_nonconformity(self, mock_dispatcher, mock_nc_class, mock_audit, mock_user):
-        # Setup
-        mock_nc = MagicMock()
-        mock_nc.id = 201
-        mock_nc_class.return_value = mock_nc
-
+    def test_create_finding(
+        self, mock_dispatcher, model_name, create, finding_type, extra_kwargs, mock_audit, mock_user
+    ):
         data = {"description": "Bad thing happened"}
 
-        # Execute
-        result = FindingService.create_nonconformity(mock_audit, mock_user, data)
-
-        # Verify
-        mock_nc_class.assert_called_once_with(
-            audit=mock_audit, created_by=mock_user, verification_status="open", **data
-        )
-        mock_nc.save.assert_called_once()
-        mock_dispatcher.emit.assert_called_once_with(
-            EventType.FINDING_CREATED,
-            {
-                "finding_id": mock_nc.id,
-                "finding_type": "nonconformity",
-                "audit_id": mock_audit.id,
-                "created_by_id": mock_user.id,
-            },
-        )
-        assert result == mock_nc
-
-    @patch("trunk.services.finding_service.Observation")
-    @patch("trunk.services.finding_service.event_dispatcher")
-    def test_create_observation(self, mock_dispatcher, mock_obs_class, mock_audit, mock_user):
-        # Setup
-        mock_obs = MagicMock()
-        mock_obs.id = 301
-        mock_obs_class.return_value = mock_obs
-
-        data = {"description": "Just looking"}
-
-        # Execute
-        result = FindingService.create_observation(mock_audit, mock_user, data)
+        with patch(f"trunk.services.finding_service.{model_name}") as mock_model:
+            result = create(mock_audit, mock_user, data)
 
-        # Verify
-        mock_obs_class.assert_called_once_with(audit=mock_audit, created_by=mock_user, **data)
-        mock_obs.save.assert_called_once()
+        finding = mock_model.return_value
+        mock_model.assert_called_once_with(audit=mock_audit, created_by=mock_user, **extra_kwargs, **data)
+        finding.save.assert_called_once()
         mock_dispatcher.emit.assert_called_once_with(
             EventType.FINDING_CREATED,
             {
-                "finding_id": mock_obs.id,
-                "finding_type": "observation",
+                "finding_id": finding.id,
+                "finding_type": finding_type,
                 "audit_id": mock_audit.id,
                 "created_by_id": mock_user.id,
             },
         )
-        assert result == mock_obs
+        assert result == finding
 
-    @patch("trunk.services.finding_service.OpportunityForImprovement")
     @patch("trunk.services.finding_service.event_dispatcher")
-    def test_create_ofi(self, mock_dispatcher, mock_ofi_class, mock_audit, mock_user):
-        # Setup
-        mock_ofi = MagicMock()
-        mock_ofi.id = 401
-        mock_ofi_class.return_value = mock_ofi
-
-        data = {"description": "Could be better"}
-
-        # Execute
-        result = FindingService.create_ofi(mock_audit, mock_user, data)
-
-        # Verify
-        mock_ofi_class.assert_called_once_with(audit=mock_audit, created_by=mock_user, **data)
-        mock_ofi.save.assert_called_once()
-        mock_dispatcher.emit.assert_called_once_with(
-            EventType.FINDING_CREATED,
-            {
-                "finding_id": mock_ofi.id,
-                "finding_type": "ofi",
-                "audit_id": mock_audit.id,
-                "created_by_id": mock_user.id,
-            },
-        )
-        assert result == mock_ofi
-
-    @patch("trunk.services.finding_service.event_dispatcher")
-    def test_respond_to_nonconformity(self, mock_dispatcher):
-        # Setup
-        mock_nc = MagicMock()
-        mock_nc.id = 201
-        mock_nc.audit.id = 1
-
+    def test_respond_to_nonconformity(self, mock_dispatcher, mock_nc):
         response_data = {"root_cause": "Human error", "correction": "Fixed it"}
 
         # Execute
@@ -129,11 +79,7 @@ class TestFindingService:
         assert result == mock_nc
 
     @patch("trunk.services.finding_service.event_dispatcher")
-    def test_verify_nonconformity_accept(self, mock_dispatcher, mock_user):
-        # Setup
-        mock_nc = MagicMock()
-        mock_nc.id = 201
-
+    def test_verify_nonconformity_accept(self, mock_dispatcher, mock_user, mock_nc):
         # Execute
         result = FindingService.verify_nonconformity(mock_nc, mock_user, "accept", notes="Looks good")
 
@@ -150,11 +96,7 @@ class TestFindingService:
         assert result == mock_nc
 
     @patch("trunk.services.finding_service.event_dispatcher")
-    def test_verify_nonconformity_reject(self, mock_dispatcher, mock_user):
-        # Setup
-        mock_nc = MagicMock()
-        mock_nc.id = 201
-
+    def test_verify_nonconformity_reject(self, mock_dispatcher, mock_user, mock_nc):
         # Execute
         result = FindingService.verify_nonconformity(mock_nc, mock_user, "request_changes", notes="Not good enough")
 
@@ -170,10 +112,8 @@ class TestFindingService:
         assert result == mock_nc
 
     @patch("trunk.services.finding_service.event_dispatcher")
-    def test_verify_nonconformity_close(self, mock_dispatcher, mock_user):
+    def test_verify_nonconformity_close(self, mock_dispatcher, mock_user, mock_nc):
         # Setup
-        mock_nc = MagicMock()
-        mock_nc.id = 201
         mock_nc.verification_status = "accepted"
 
         # Execute
@@ -189,96 +129,41 @@ class TestFindingService:
         )
         assert result == mock_nc
 
-    def test_verify_nonconformity_close_invalid(self, mock_user):
+    def test_verify_nonconformity_close_invalid(self, mock_user, mock_nc):
         # Setup
-        mock_nc = MagicMock()
         mock_nc.verification_status = "open"
 
         # Execute & Verify
         with pytest.raises(ValidationError, match="Cannot close nonconformity that hasn't been accepted"):
             FindingService.verify_nonconformity(mock_nc, mock_user, "close")
 
+    @pytest.mark.parametrize(
+        ("update", "finding_type"),
+        [
+            (FindingService.update_nonconformity, "nonconformity"),
+            (FindingService.update_observation, "observation"),
+            (FindingService.update_ofi, "ofi"),
+        ],
+    )
     @patch("trunk.services.finding_service.event_dispatcher")
-    def test_update_nonconformity(self, mock_dispatcher, mock_user):
-        # Setup
-        mock_nc = MagicMock()
-        mock_nc.id = 201
-        mock_nc.audit.id = 1
-
+    def test_update_finding(self, mock_dispatcher, update, finding_type, mock_user, mock_nc):
         data = {"description": "Updated description"}
 
-        # Execute
-        result = FindingService.update_nonconformity(mock_nc, data, mock_user)
+        result = update(mock_nc, data, mock_user)
 
-        # Verify
         assert mock_nc.description == "Updated description"
         mock_nc.save.assert_called_once()
-
         mock_dispatcher.emit.assert_called_once_with(
             EventType.FINDING_UPDATED,
             {
                 "finding_id": mock_nc.id,
-                "finding_type": "nonconformity",
+                "finding_type": finding_type,
                 "audit_id": 1,
                 "updated_by_id": mock_user.id,
             },
         )
         assert result == mock_nc
 
-    @patch("trunk.services.finding_service.event_dispatcher")
-    def test_update_observation(self, mock_dispatcher, mock_user):
-        # Setup
-        mock_obs = MagicMock()
-        mock_obs.id = 301
-        mock_obs.audit.id = 1
-
-        data = {"description": "Updated obs"}
-
-        # Execute
-        result = FindingService.update_observation(mock_obs, data, mock_user)
-
-        # Verify
-        assert mock_obs.description == "Updated obs"
-        mock_obs.save.assert_called_once()
-
-        mock_dispatcher.emit.assert_called_once_with(
-            EventType.FINDING_UPDATED,
-            {
-                "finding_id": mock_obs.id,
-                "finding_type": "observation",
-                "audit_id": 1,
-                "updated_by_id": mock_user.id,
-            },
-        )
-        assert result == mock_obs
-
-    @patch("trunk.services.finding_service.event_dispatcher")
-    def test_update_ofi(self, mock_dispatcher, mock_user):
-        # Setup
-        mock_ofi = MagicMock()
-        mock_ofi.id = 401
-        mock_ofi.audit.id = 1
-
-        data = {"description": "Updated ofi"}
-
-        # Execute
-        result = FindingService.update_ofi(mock_ofi, data, mock_user)
-
-        # Verify
-        assert mock_ofi.description == "Updated ofi"
-        mock_ofi.save.assert_called_once()
-
-        mock_dispatcher.emit.assert_called_once_with(
-            EventType.FINDING_UPDATED,
-            {
-                "finding_id": mock_ofi.id,
-                "finding_type": "ofi",
-                "audit_id": 1,
-                "updated_by_id": mock_user.id,
-            },
-        )
-        assert result == mock_ofi
-
     @patch("trunk.services.finding_service.event_dispatcher")
     def test_delete_finding(self, mock_dispatcher, mock_user):
         # Setup
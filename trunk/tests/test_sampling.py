@@ -49,6 +49,23 @@ class TestSampling:
         assert result["minimum_sites"] == 16
         assert len(result["risk_factors"]) == 3
 
+    def test_calculate_sample_size_perfect_square_boundaries(self):
+        # sqrt(16) = 4 exactly, sqrt(17) = 4.12 -> 5
+        assert calculate_sample_size(total_sites=16)["base_calculation"] == 4
+        assert calculate_sample_size(total_sites=17)["base_calculation"] == 5
+        # sqrt(20) - 0.5 = 3.97 -> 4, sqrt(21) - 0.5 = 4.08 -> 5
+        assert calculate_sample_size(total_sites=20, is_initial_certification=False)["base_calculation"] == 4
+        assert calculate_sample_size(total_sites=21, is_initial_certification=False)["base_calculation"] == 5
+
+    def test_calculate_sample_size_results_are_independent(self):
+        first = calculate_sample_size(total_sites=100, high_risk_sites=10, is_initial_certification=True)
+        first["risk_factors"].append("mutated")
+        first["minimum_sites"] = 0
+
+        second = calculate_sample_size(total_sites=100, high_risk_sites=10, is_initial_certification=True)
+        assert second["minimum_sites"] == 12
+        assert "mutated" not in second["risk_factors"]
+
     def test_calculate_sample_size_moderate_scope(self):
         # Base: sqrt(100) = 10
         # Moderate scope -> +1
@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock
 
 import pytest
-from django.contrib.auth.models import Group, User
+from django.contrib.auth.models import AnonymousUser, Group, User
 
 from core.models import Organization
 from identity.adapters.models import Profile
@@ -113,6 +113,58 @@ class TestPermissionPredicate:
         assert PermissionPredicate.can_view_audit(self.user, audit)
 
 
+@pytest.mark.django_db
+class TestCachedGroups:
+    def setup_method(self):
+        self.user = User.objects.create_user(username="testuser", password="password")
+        self.user.groups.add(Group.objects.create(name="cb_admin"), Group.objects.create(name="auditor"))
+
+    def test_predicates_share_one_query(self, django_assert_num_queries):
+        with django_assert_num_queries(1), PermissionPredicate.cached_groups(self.user):
+            assert PermissionPredicate.is_cb_admin(self.user)
+            assert PermissionPredicate.is_auditor(self.user)
+            assert not PermissionPredicate.is_lead_auditor(self.user)
+            assert not PermissionPredicate.is_client_user(self.user)
+            assert PermissionPredicate.can_conduct_technical_review(self.user)
+
+        assert not hasattr(self.user, "_cached_groups")
+
+    def test_nested_block_keeps_outer_cache(self, django_assert_num_queries):
+        with PermissionPredicate.cached_groups(self.user):
+            outer = self.user._cached_groups
+            with django_assert_num_queries(0), PermissionPredicate.cached_groups(self.user):
+                assert PermissionPredicate.is_cb_admin(self.user)
+            assert self.user._cached_groups is outer
+
+        assert not hasattr(self.user, "_cached_groups")
+
+    def test_cache_removed_when_body_raises(self):
+        with pytest.raises(RuntimeError), PermissionPredicate.cached_groups(self.user):
+            raise RuntimeError("boom")
+
+        assert not hasattr(self.user, "_cached_groups")
+
+    def test_unsaved_user_is_not_cached(self):
+        user = User(username="unsaved")
+        with PermissionPredicate.cached_groups(user):
+            assert not hasattr(user, "_cached_groups")
+
+    def test_mock_user_falls_back_to_query(self):
+        user = MagicMock()
+        user.groups.filter.return_value.exists.return_value = True
+
+        with PermissionPredicate.cached_groups(user):
+            assert PermissionPredicate.is_cb_admin(user)
+
+        user.groups.filter.assert_called_once_with(name="cb_admin")
+
+    def test_anonymous_user_falls_back_to_query(self, django_assert_num_queries):
+        user = AnonymousUser()
+        with django_assert_num_queries(0), PermissionPredicate.cached_groups(user):
+            assert not hasattr(user, "_cached_groups")
+            assert not PermissionPredicate.is_cb_admin(user)
+
+
 @pytest.mark.django_db
 class TestPBACPolicy:
     def setup_method(self):
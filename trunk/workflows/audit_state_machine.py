@@ -44,14 +44,22 @@ class AuditStateMachine:
 
     # ----- Public API -----
     def can_transition(self, to_state: str, user) -> Tuple[bool, str]:
-        return self._sm.can_transition(to_state, user)
+        from trunk.permissions.predicates import PermissionPredicate
+
+        # The permission checker may test several roles; answer them from one group lookup
+        with PermissionPredicate.cached_groups(user):
+            return self._sm.can_transition(to_state, user)
 
     def transition(self, to_state: str, user, notes: str = ""):
-        ok, reason = self.can_transition(to_state, user)
-        if not ok:
-            raise ValidationError(reason)
-        old_status = self.audit.status
-        self._sm.transition(to_state, user)
+        from trunk.permissions.predicates import PermissionPredicate
+
+        # Both permission checks (ours and the inner StateMachine's) share one group lookup
+        with PermissionPredicate.cached_groups(user):
+            ok, reason = self.can_transition(to_state, user)
+            if not ok:
+                raise ValidationError(reason)
+            old_status = self.audit.status
+            self._sm.transition(to_state, user)
         # Create audit status log entry (preserve legacy behavior)
         from audit_management.models import AuditStatusLog
 
@@ -65,7 +73,10 @@ class AuditStateMachine:
         return self.audit
 
     def available_transitions(self, user) -> List[Tuple[str, str]]:
-        return self._sm.available_transitions(user)
+        from trunk.permissions.predicates import PermissionPredicate
+
+        with PermissionPredicate.cached_groups(user):
+            return self._sm.available_transitions(user)
 
     # ----- Internal helpers -----
     def _set_state(self, audit, new_status: str) -> None:
@@ -55,7 +55,12 @@ class AuditWorkflow:
     }
 
     def __init__(self, audit):
-        """Initialize workflow for given audit."""
+        """
+        Initialize workflow for given audit.
+
+        No state is cached: every check reads the audit as it is at call time, so one
+        instance stays valid across status changes and refresh_from_db().
+        """
         self.audit = audit
 
     def can_transition_to(self, new_status):
@@ -127,13 +132,13 @@ class AuditWorkflow:
 
     def _validate_report_draft(self):
         """Validate transition to report_draft status."""
-        # Must have at least one finding (NC, Observation, or OFI)
-        total_findings = (
-            self.audit.nonconformity_set.count()
-            + self.audit.observation_set.count()
-            + self.audit.opportunityforimprovement_set.count()
+        # Must have at least one finding (NC, Observation, or OFI); stop at the first hit
+        has_findings = (
+            self.audit.nonconformity_set.exists()
+            or self.audit.observation_set.exists()
+            or self.audit.opportunityforimprovement_set.exists()
         )
-        if total_findings == 0:
+        if not has_findings:
             raise ValidationError(
                 "Cannot move to report draft without at least one finding. "
                 "Add a nonconformity, observation, or opportunity for improvement."
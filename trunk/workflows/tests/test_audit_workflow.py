@@ -2,41 +2,50 @@ from datetime import date, timedelta
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db.models.signals import post_save
 from django.test import TestCase
 
 from audit_management.models import Audit, Nonconformity
 from certification.models import TechnicalReview
 from core.models import Certification, Organization, Site, Standard
-from core.test_utils import TEST_PASSWORD_DEFAULT
+from core.test_utils import mute_signals
 from trunk.workflows.audit_workflow import AuditWorkflow
 
 
 class AuditWorkflowTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(username="testuser", password=TEST_PASSWORD_DEFAULT)
-        self.org = Organization.objects.create(name="Test Org", customer_id="CUST-001", total_employee_count=10)
-        self.standard = Standard.objects.create(title="ISO 9001", code="ISO9001")
-        self.cert = Certification.objects.create(
-            organization=self.org,
-            standard=self.standard,
+    @classmethod
+    def setUpTestData(cls):
+        # The workflow never authenticates this user or reads its profile, so leave the password
+        # unusable and skip the post_save profile receivers
+        with mute_signals(post_save):
+            cls.user = User.objects.create_user(username="testuser")
+        # One date for every fixture, so issue and audit dates agree even if a run crosses midnight
+        cls.today = date.today()
+        cls.org = Organization.objects.create(name="Test Org", customer_id="CUST-001", total_employee_count=10)
+        cls.standard = Standard.objects.create(title="ISO 9001", code="ISO9001")
+        cls.cert = Certification.objects.create(
+            organization=cls.org,
+            standard=cls.standard,
             certificate_status="active",
-            issue_date=date.today(),
-            expiry_date=date.today() + timedelta(days=365),
+            issue_date=cls.today,
+            expiry_date=cls.today + timedelta(days=365),
         )
-        self.site = Site.objects.create(organization=self.org, site_name="Main Site", site_address="123 Main St")
+        cls.site = Site.objects.create(organization=cls.org, site_name="Main Site", site_address="123 Main St")
 
-        self.audit = Audit.objects.create(
-            organization=self.org,
+        cls.audit = Audit.objects.create(
+            organization=cls.org,
             audit_type="stage1",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today() + timedelta(days=2),
-            lead_auditor=self.user,
-            created_by=self.user,
+            total_audit_date_from=cls.today,
+            total_audit_date_to=cls.today + timedelta(days=2),
+            lead_auditor=cls.user,
+            created_by=cls.user,
             status="draft",
         )
-        self.audit.certifications.add(self.cert)
-        self.audit.sites.add(self.site)
+        cls.audit.certifications.add(cls.cert)
+        cls.audit.sites.add(cls.site)
 
+    def setUp(self):
+        # self.audit is a per-test copy of the class fixture, so the workflow must wrap it here
         self.workflow = AuditWorkflow(self.audit)
 
     def test_can_transition_to(self):
@@ -95,7 +104,9 @@ class AuditWorkflowTest(TestCase):
             site=self.site,
         )
         try:
-            self.workflow.validate_transition("report_draft")
+            # The NC satisfies the check, so the observation/OFI lookups are skipped
+            with self.assertNumQueries(1):
+                self.workflow.validate_transition("report_draft")
         except ValidationError:
             self.fail("validate_transition('report_draft') raised ValidationError unexpectedly!")
 
@@ -168,8 +179,8 @@ class AuditWorkflowTest(TestCase):
             organization=self.org,
             audit_type="stage1",
             status="closed",
-            total_audit_date_from=date.today(),
-            total_audit_date_to=date.today(),
+            total_audit_date_from=self.today,
+            total_audit_date_to=self.today,
             lead_auditor=self.user,
             created_by=self.user,
         )
@@ -253,7 +264,7 @@ class AuditWorkflowTest(TestCase):
     def test_transition_to(self):
         self.audit.status = "draft"
         self.workflow.transition_to("scheduled")
-        self.audit.refresh_from_db()
+        self.audit.refresh_from_db(fields=["status"])
         self.assertEqual(self.audit.status, "scheduled")
 
     def test_get_available_transitions(self):